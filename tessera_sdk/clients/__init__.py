@@ -11,6 +11,7 @@ from .looply import LooplyClient
 from .modela import ModelaClient
 from ._base import (
     BaseClient,
+    AsyncBaseClient,
     TesseraError,
     TesseraClientError,
     TesseraServerError,
@@ -28,6 +29,7 @@ __all__ = [
     "LooplyClient",
     "ModelaClient",
     "BaseClient",
+    "AsyncBaseClient",
     "TesseraError",
     "TesseraClientError",
     "TesseraServerError",
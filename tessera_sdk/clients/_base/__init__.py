@@ -3,6 +3,7 @@ Base client and exceptions for the Tessera SDK.
 """
 
 from .client import BaseClient
+from .async_client import AsyncBaseClient
 from .exceptions import (
     TesseraError,
     TesseraClientError,
@@ -14,6 +15,7 @@ from .exceptions import (
 
 __all__ = [
     "BaseClient",
+    "AsyncBaseClient",
     "TesseraError",
     "TesseraClientError",
     "TesseraServerError",
@@ -0,0 +1,159 @@
+"""
+Async base client class for Tessera SDK clients used from an event loop.
+"""
+
+import logging
+from typing import Optional, Dict, Any
+
+import httpx
+
+from ...config import get_settings
+from .client import _check_response, _get_version
+from .exceptions import TesseraError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseClient:
+    """
+    Async counterpart of BaseClient backed by httpx.AsyncClient.
+
+    Use it from async hosts (e.g. FastAPI) so network-bound calls do not
+    block the event loop. Errors are mapped exactly as in BaseClient.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: Optional[str] = None,
+        timeout: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        service_name: str = "tessera",
+        http2: bool = False,
+    ):
+        """
+        Initialize the async base client.
+
+        Args:
+            base_url: The base URL of the API (e.g., "https://api.yourdomain.com")
+            api_token: Optional API token for authentication
+            timeout: Request timeout in seconds
+            client: Optional httpx.AsyncClient instance to use
+            service_name: Name of the service for User-Agent header
+            http2: Negotiate HTTP/2 so concurrent calls share one connection;
+                requires the optional h2 package (tessera-sdk[http2]). Ignored
+                when client is given.
+        """
+        settings = get_settings()
+        self.base_url = base_url.rstrip("/")
+        self.api_token = api_token
+        self.timeout = (
+            int(timeout)
+            if timeout is not None
+            else int(settings.tesserasdk_base_client_timeout)
+        )
+        self.service_name = service_name
+
+        # Keep one client per instance so connections are reused across calls.
+        self._client = client or httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2,
+        )
+
+        self.default_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "User-Agent": f"{service_name}-client/{_get_version()}",
+        }
+
+        if api_token:
+            self.default_headers["Authorization"] = f"Bearer {api_token}"
+
+        # Multipart uploads let the HTTP library set Content-Type (with boundary).
+        self._upload_headers = {
+            k: v for k, v in self.default_headers.items() if k != "Content-Type"
+        }
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+    ) -> httpx.Response:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint path (e.g., "/clients")
+            data: Request data for JSON requests
+            files: Files for multipart requests
+            params: Query parameters
+            headers: Additional headers
+            body: Pre-encoded JSON body, sent as-is instead of data
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            TesseraClientError: For 4xx status codes
+            TesseraServerError: For 5xx status codes
+            TesseraError: For other errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        class_name = type(self).__name__
+
+        logger.info("Making %s request to %s", method, url)
+
+        # Reuse the prebuilt header dicts; only merge when the caller adds headers.
+        request_headers = self._upload_headers if files else self.default_headers
+        if headers:
+            request_headers = {**request_headers, **headers}
+            if files:
+                # For file uploads, don't set Content-Type header
+                request_headers.pop("Content-Type", None)
+
+        try:
+            if files:
+                response = await self._client.request(
+                    method,
+                    url,
+                    data=data,
+                    files=files,
+                    params=params,
+                    headers=request_headers,
+                )
+            elif body is not None:
+                response = await self._client.request(
+                    method,
+                    url,
+                    content=body,
+                    params=params,
+                    headers=request_headers,
+                )
+            else:
+                response = await self._client.request(
+                    method,
+                    url,
+                    json=data,
+                    params=params,
+                    headers=request_headers,
+                )
+        except httpx.HTTPError as e:
+            logger.exception(
+                "[%s] HTTP request failed\nMethod: %s\nURL: %s",
+                class_name,
+                method,
+                url,
+            )
+            raise TesseraError(f"[{class_name}] {method} {url} failed: {e}") from e
+
+        return _check_response(response, endpoint, class_name)
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its connections."""
+        await self._client.aclose()
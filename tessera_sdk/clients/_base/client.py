@@ -2,11 +2,16 @@
 Base client class for all Tessera SDK clients.
 """
 
+import json
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ...config import get_settings
+from ...constants import HTTPMethods
 from .exceptions import (
     TesseraError,
     TesseraClientError,
@@ -18,6 +23,138 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size of the shared session, per host.
+SHARED_POOL_SIZE = 100
+
+# Gateway errors worth retrying, and the idempotent methods they apply to.
+_RETRY_STATUSES = (502, 503, 504)
+_RETRY_METHODS = HTTPMethods.ALL_METHODS - {HTTPMethods.POST}
+
+
+@lru_cache(maxsize=1)
+def _get_version() -> str:
+    """Get the client version (resolved once per process)."""
+    try:
+        from ... import __version__
+
+        return __version__
+    except ImportError:
+        return "unknown"
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled session shared by all clients that are not given one."""
+    session = requests.Session()
+    # Retry failed connects (the request never reached the server) and gateway
+    # errors on idempotent methods; the final response is returned as-is.
+    retry_strategy = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=2,
+        backoff_factor=0.2,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=SHARED_POOL_SIZE,
+        pool_maxsize=SHARED_POOL_SIZE,
+        max_retries=retry_strategy,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_session()
+
+# Status codes with a dedicated exception type, mapped to (exception, default detail).
+_STATUS_ERRORS = {
+    400: (TesseraValidationError, "Bad request"),
+    401: (TesseraAuthenticationError, "Authentication failed"),
+    404: (TesseraNotFoundError, "Resource not found"),
+}
+
+
+def _error_detail(response, default: str) -> Any:
+    """
+    Return the "detail" field of an error response body, or default.
+
+    The raw body is decoded once with json.loads, skipping the charset
+    detection response.json() does and the exception for empty bodies.
+
+    Args:
+        response: HTTP response (requests or httpx)
+        default: Value returned when the body has no usable detail
+
+    Returns:
+        The detail from the body, or default
+    """
+    content = response.content
+    if not content:
+        return default
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return default
+    if not isinstance(body, dict):
+        return default
+    return body.get("detail", default)
+
+
+def _check_response(response, endpoint: str, class_name: str):
+    """
+    Return the response if successful, otherwise raise the matching Tessera error.
+
+    Works with both requests and httpx responses.
+
+    Args:
+        response: HTTP response
+        endpoint: API endpoint path, used in error messages
+        class_name: Name of the calling client class, used in error messages
+
+    Returns:
+        The response, if its status code is below 400
+
+    Raises:
+        TesseraClientError: For 4xx status codes
+        TesseraServerError: For 5xx status codes
+        TesseraError: For other errors
+    """
+    # Handle different status codes
+    status_code = response.status_code
+    if status_code < 400:
+        return response
+
+    specific = _STATUS_ERRORS.get(status_code)
+    if specific is not None:
+        error_class, default_detail = specific
+        detail = _error_detail(response, default_detail)
+        raise error_class(f"[{class_name}] {endpoint}: {detail}")
+
+    if status_code < 500:
+        detail = _error_detail(response, response.text or "Client error")
+        raise TesseraClientError(
+            f"[{class_name}] {endpoint}: {status_code} {detail}",
+            status_code,
+        )
+
+    if status_code < 600:
+        logger.error(
+            "[%s] Server error %s\nURL: %s\nResponse body: %s",
+            class_name,
+            status_code,
+            response.url,
+            response.text,
+        )
+        raise TesseraServerError(
+            f"[{class_name}] Server error: {status_code}",
+            status_code,
+        )
+
+    raise TesseraError(f"[{class_name}] Unexpected status code: {status_code}")
+
 
 class BaseClient:
     """
@@ -42,7 +179,8 @@ class BaseClient:
             base_url: The base URL of the API (e.g., "https://api.yourdomain.com")
             api_token: Optional API token for authentication
             timeout: Request timeout in seconds
-            session: Optional requests.Session instance to use
+            session: Optional requests.Session instance to use; defaults to a
+                pooled session shared (thread-safely) by all clients
             service_name: Name of the service for User-Agent header
         """
         settings = get_settings()
@@ -56,32 +194,22 @@ class BaseClient:
         )
         self.service_name = service_name
 
-        # Create or use provided session
-        self.session = session or requests.Session()
+        # Use the provided session or the process-wide pooled one. Headers are
+        # kept per instance and sent per request so the session can be shared.
+        self.session = session or _SHARED_SESSION
 
-        # Set default headers
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "User-Agent": f"{service_name}-client/{self._get_version()}",
-            }
-        )
+        self.default_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "User-Agent": f"{service_name}-client/{_get_version()}",
+        }
 
         if api_token:
-            self.session.headers.update(
-                {
-                    "Authorization": f"Bearer {api_token}",
-                }
-            )
+            self.default_headers["Authorization"] = f"Bearer {api_token}"
 
-    def _get_version(self) -> str:
-        """Get the client version."""
-        try:
-            from ... import __version__
-
-            return __version__
-        except ImportError:
-            return "unknown"
+        # Multipart uploads let the HTTP library set Content-Type (with boundary).
+        self._upload_headers = {
+            k: v for k, v in self.default_headers.items() if k != "Content-Type"
+        }
 
     def _make_request(
         self,
@@ -91,6 +219,7 @@ class BaseClient:
         files: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
     ) -> requests.Response:
         """
         Make an HTTP request to the API.
@@ -102,6 +231,7 @@ class BaseClient:
             files: Files for multipart requests
             params: Query parameters
             headers: Additional headers
+            body: Pre-encoded JSON body, sent as-is instead of data
 
         Returns:
             requests.Response object
@@ -112,18 +242,20 @@ class BaseClient:
             TesseraError: For other errors
         """
         url = f"{self.base_url}{endpoint}"
+        class_name = type(self).__name__
 
-        logger.info(f"Making {method} request to {url}")
+        logger.info("Making %s request to %s", method, url)
 
-        request_headers = {}
+        # Reuse the prebuilt header dicts; only merge when the caller adds headers.
+        request_headers = self._upload_headers if files else self.default_headers
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
+            if files:
+                # For file uploads, don't set Content-Type header
+                request_headers.pop("Content-Type", None)
 
         try:
             if files:
-                # For file uploads, don't set Content-Type header
-                if "Content-Type" in request_headers:
-                    del request_headers["Content-Type"]
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -133,68 +265,25 @@ class BaseClient:
                     headers=request_headers,
                     timeout=self.timeout,
                 )
-            else:
+            elif body is not None:
                 response = self.session.request(
                     method=method,
                     url=url,
-                    json=data,
+                    data=body,
                     params=params,
                     headers=request_headers,
                     timeout=self.timeout,
                 )
-
-            # Handle different status codes
-            class_name = self.__class__.__name__
-            if response.status_code < 400:
-                return response
-            elif response.status_code == 401:
-                try:
-                    detail = response.json().get("detail", "Authentication failed")
-                except (ValueError, KeyError):
-                    detail = "Authentication failed"
-                raise TesseraAuthenticationError(f"[{class_name}] {endpoint}: {detail}")
-            elif response.status_code == 404:
-                try:
-                    detail = response.json().get("detail", "Resource not found")
-                except (ValueError, KeyError):
-                    detail = "Resource not found"
-                raise TesseraNotFoundError(f"[{class_name}] {endpoint}: {detail}")
-            elif response.status_code == 400:
-                try:
-                    detail = response.json().get("detail", "Bad request")
-                except (ValueError, KeyError):
-                    detail = "Bad request"
-                raise TesseraValidationError(f"[{class_name}] {endpoint}: {detail}")
-            elif 400 <= response.status_code < 500:
-                try:
-                    detail = response.json().get(
-                        "detail", response.text or "Client error"
-                    )
-                except (ValueError, KeyError):
-                    detail = response.text or "Client error"
-                raise TesseraClientError(
-                    f"[{class_name}] {endpoint}: {response.status_code} {detail}",
-                    response.status_code,
-                )
-            elif 500 <= response.status_code < 600:
-                logger.error(
-                    "[%s] Server error %s\nURL: %s\nResponse body: %s",
-                    class_name,
-                    response.status_code,
-                    response.url,
-                    response.text,
-                )
-                raise TesseraServerError(
-                    f"[{class_name}] Server error: {response.status_code}",
-                    response.status_code,
-                )
             else:
-                raise TesseraError(
-                    f"[{class_name}] Unexpected status code: {response.status_code}"
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                    headers=request_headers,
+                    timeout=self.timeout,
                 )
-
         except requests.exceptions.RequestException as e:
-            class_name = self.__class__.__name__
             logger.exception(
                 "[%s] HTTP request failed\nMethod: %s\nURL: %s",
                 class_name,
@@ -202,3 +291,5 @@ class BaseClient:
                 url,
             )
             raise TesseraError(f"[{class_name}] {method} {url} failed: {e}") from e
+
+        return _check_response(response, endpoint, class_name)
@@ -6,14 +6,22 @@ Base exceptions for the Tessera SDK.
 class TesseraError(Exception):
     """Base exception for all Tessera-related errors."""
 
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message)
         self.status_code = status_code
 
+    def __reduce__(self):
+        # Slots are not part of the default exception pickle state.
+        return (type(self), (*self.args, self.status_code))
+
 
 class TesseraClientError(TesseraError):
     """Exception raised for client-side errors (4xx status codes)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message, status_code)
 
@@ -21,6 +29,8 @@ class TesseraClientError(TesseraError):
 class TesseraServerError(TesseraError):
     """Exception raised for server-side errors (5xx status codes)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message, status_code)
 
@@ -28,6 +38,8 @@ class TesseraServerError(TesseraError):
 class TesseraAuthenticationError(TesseraError):
     """Exception raised for authentication errors (401 status code)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed", status_code: int = 401):
         super().__init__(message, status_code)
 
@@ -35,6 +47,8 @@ class TesseraAuthenticationError(TesseraError):
 class TesseraNotFoundError(TesseraError):
     """Exception raised when a resource is not found (404 status code)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found", status_code: int = 404):
         super().__init__(message, status_code)
 
@@ -42,5 +56,7 @@ class TesseraNotFoundError(TesseraError):
 class TesseraValidationError(TesseraError):
     """Exception raised for validation errors (400 status code)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation error", status_code: int = 400):
         super().__init__(message, status_code)
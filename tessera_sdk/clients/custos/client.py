@@ -3,19 +3,26 @@ Main Custos client for interacting with the Custos API.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 import requests
+from pydantic_core import to_json
 
 from .._base.client import BaseClient
 from ...constants import HTTPMethods
-from .schemas.authorize_request import AuthorizeRequest
 from .schemas.authorize_response import AuthorizeResponse
-from .schemas.membership_request import CreateMembershipRequest, DeleteMembershipRequest
+from .schemas.membership_request import CreateMembershipRequest
 from .schemas.membership_response import MembershipResponse
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _memberships_endpoint(role_identifier: str) -> str:
+    """Return the memberships endpoint for a role, formatted once per role."""
+    return f"/roles/{role_identifier}/memberships"
+
+
 class CustosClient(BaseClient):
     """
     A client for interacting with the Custos API.
@@ -37,7 +44,8 @@ class CustosClient(BaseClient):
             base_url: The base URL of the Custos API (e.g., "https://custos-api.yourdomain.com")
             api_token: Optional API token for authentication
             timeout: Request timeout in seconds
-            session: Optional requests.Session instance to use
+            session: Optional requests.Session instance to use; defaults to the
+                pooled session shared by all clients
         """
         super().__init__(
             base_url=base_url,
@@ -68,17 +76,20 @@ class CustosClient(BaseClient):
         """
         endpoint = "/authorization/authorize"
 
-        request = AuthorizeRequest(
-            user_id=user_id,
-            action=action,
-            resource=resource,
-            domain=domain,
+        # Body follows AuthorizeRequest. Four typed strings need no model, so
+        # encode them directly with pydantic-core on this hot path.
+        body = to_json(
+            {
+                "user_id": user_id,
+                "action": action,
+                "resource": resource,
+                "domain": domain,
+            }
         )
 
-        response = self._make_request(
-            HTTPMethods.POST, endpoint, data=request.model_dump()
-        )
-        return AuthorizeResponse(**response.json())
+        response = self._make_request(HTTPMethods.POST, endpoint, body=body)
+        # Validate the raw body in pydantic-core instead of json() + kwargs.
+        return AuthorizeResponse.model_validate_json(response.content)
 
     def create_membership(
         self,
@@ -90,18 +101,18 @@ class CustosClient(BaseClient):
         """
         Create a membership for a role.
         """
-        endpoint = f"/roles/{role_identifier}/memberships"
+        endpoint = _memberships_endpoint(role_identifier)
 
-        request = CreateMembershipRequest(
+        request = CreateMembershipRequest.model_construct(
             user_id=user_id,
             domain=domain,
             domain_metadata=domain_metadata or {},
         )
 
         response = self._make_request(
-            HTTPMethods.POST, endpoint, data=request.model_dump()
+            HTTPMethods.POST, endpoint, body=request.model_dump_json().encode()
         )
-        return MembershipResponse(**response.json())
+        return MembershipResponse.model_validate_json(response.content)
 
     def delete_membership(
         self,
@@ -112,15 +123,11 @@ class CustosClient(BaseClient):
         """
         Delete a membership for a role.
         """
-        endpoint = f"/roles/{role_identifier}/memberships"
-
-        request = DeleteMembershipRequest(
-            user_id=user_id,
-            domain=domain,
-        )
+        endpoint = _memberships_endpoint(role_identifier)
 
+        # Body follows DeleteMembershipRequest; both fields are plain strings.
         self._make_request(
             HTTPMethods.DELETE,
             endpoint,
-            data=request.model_dump(),
+            data={"user_id": user_id, "domain": domain},
         )
@@ -13,24 +13,24 @@ from .._base.exceptions import (
 
 
 class CustosError(TesseraError):
-    pass
+    __slots__ = ()
 
 
 class CustosClientError(TesseraClientError):
-    pass
+    __slots__ = ()
 
 
 class CustosServerError(TesseraServerError):
-    pass
+    __slots__ = ()
 
 
 class CustosAuthenticationError(TesseraAuthenticationError):
-    pass
+    __slots__ = ()
 
 
 class CustosNotFoundError(TesseraNotFoundError):
-    pass
+    __slots__ = ()
 
 
 class CustosValidationError(TesseraValidationError):
-    pass
+    __slots__ = ()
@@ -1,11 +1,20 @@
 """
 Schemas for the Custos client.
+
+Schemas are imported on first attribute access (PEP 562), so importing the
+package does not build every pydantic model up front.
 """
 
-from .authorize_request import AuthorizeRequest
-from .authorize_response import AuthorizeResponse
-from .membership_request import CreateMembershipRequest, DeleteMembershipRequest
-from .membership_response import MembershipResponse
+import importlib
+
+# Exported name -> submodule that defines it.
+_LAZY = {
+    "AuthorizeRequest": "authorize_request",
+    "AuthorizeResponse": "authorize_response",
+    "CreateMembershipRequest": "membership_request",
+    "DeleteMembershipRequest": "membership_request",
+    "MembershipResponse": "membership_response",
+}
 
 __all__ = [
     "AuthorizeRequest",
@@ -14,3 +23,16 @@ __all__ = [
     "DeleteMembershipRequest",
     "MembershipResponse",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -23,4 +23,5 @@ class AuthorizeResponse(BaseModel):
     reason: Optional[str] = None
     """Optional message from the authorization service."""
 
-    model_config = {"from_attributes": True}
+    # Built on first use rather than at import.
+    model_config = {"from_attributes": True, "defer_build": True}
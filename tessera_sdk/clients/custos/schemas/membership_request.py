@@ -1,5 +1,16 @@
-from pydantic import BaseModel, Field
-from typing import Dict, Any
+from pydantic import BaseModel, Field, PlainValidator
+from typing import Annotated, Dict, Any
+
+
+def _opaque_dict(value: Any) -> Dict[str, Any]:
+    """Accept a dict as-is, without copying or validating its items."""
+    if not isinstance(value, dict):
+        raise ValueError("domain_metadata must be a dict")
+    return value
+
+
+# Metadata is passed through to Custos untouched, so skip per-item validation.
+OpaqueMetadata = Annotated[Dict[str, Any], PlainValidator(_opaque_dict)]
 
 
 class CreateMembershipRequest(BaseModel):
@@ -11,7 +22,7 @@ class CreateMembershipRequest(BaseModel):
     domain: str
     """Domain identifier for the membership."""
 
-    domain_metadata: Dict[str, Any] = Field(default_factory=dict)
+    domain_metadata: OpaqueMetadata = Field(default_factory=dict)
     """Metadata for the domain."""
 
     model_config = {"from_attributes": True}
@@ -26,4 +37,5 @@ class DeleteMembershipRequest(BaseModel):
     domain: str
     """Domain identifier for the membership."""
 
-    model_config = {"from_attributes": True}
+    # Built on first use rather than at import.
+    model_config = {"from_attributes": True, "defer_build": True}
@@ -29,4 +29,5 @@ class MembershipResponse(BaseModel):
     created_at: Optional[str] = None
     """Timestamp when the membership was created."""
 
-    model_config = {"from_attributes": True}
+    # Built on first use rather than at import.
+    model_config = {"from_attributes": True, "defer_build": True}
@@ -3,10 +3,12 @@ Identies Client - A Python client for the Identies API.
 """
 
 from .client import IdentiesClient
+from .async_client import AsyncIdentiesClient
 from .exceptions import IdentiesError, IdentiesClientError, IdentiesServerError
 
 __all__ = [
     "IdentiesClient",
+    "AsyncIdentiesClient",
     "IdentiesError",
     "IdentiesClientError",
     "IdentiesServerError",
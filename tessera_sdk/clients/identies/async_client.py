@@ -0,0 +1,483 @@
+"""
+Async Identies client for use from an event loop.
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Optional, Union
+
+import httpx
+
+from .._base.async_client import AsyncBaseClient
+from ...constants import HTTPMethods
+from .client import USER_CACHE_SIZE, _resolve_user, _user_cache_key
+from .schemas.external_account_response import (
+    CheckResponse,
+    ExternalAccountPageResponse,
+    ExternalAccountResponse,
+    LinkTokenResponse,
+)
+from .schemas.introspect_response import IntrospectResponse
+from .schemas.oauth_token_response import OAuthTokenResponse
+from .schemas.token_exchange_response import TokenExchangeResponse
+from .schemas.user_response import UserResponse
+from ...config import get_settings
+from ...utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncIdentiesClient(AsyncBaseClient):
+    """
+    An async client for the Identies API.
+
+    Mirrors IdentiesClient so async hosts can call Identies without
+    blocking the event loop; concurrent calls share one connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_token: Optional[str] = None,
+        timeout: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+    ):
+        """
+        Initialize the async Identies client.
+
+        Args:
+            base_url: The base URL of the Identies API (e.g., "https://identies-api.yourdomain.com")
+            api_token: Optional API token for authentication
+            timeout: Request timeout in seconds
+            client: Optional httpx.AsyncClient instance to use
+            http2: Negotiate HTTP/2; requires the optional h2 package
+        """
+        super().__init__(
+            base_url=base_url or get_settings().identies_api_url,
+            api_token=api_token,
+            timeout=timeout,
+            client=client,
+            service_name="identies",
+            http2=http2,
+        )
+
+        # Last user response per endpoint and token, with its ETag /
+        # Last-Modified validators, copied out on 304 Not Modified.
+        self._user_cache = TTLCache(maxsize=USER_CACHE_SIZE)
+
+    async def _get_user_response(
+        self, endpoint: str, token: Optional[str] = None
+    ) -> UserResponse:
+        """
+        GET a user endpoint, revalidating a previously cached response.
+
+        Args:
+            endpoint: User endpoint path (e.g., "/userinfo")
+            token: Optional user access token sent as a Bearer header
+
+        Returns:
+            UserResponse object
+        """
+        cache_key = _user_cache_key(endpoint, token)
+        cached = self._user_cache.get(cache_key)
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if cached is not None:
+            headers.update(cached[0])
+        response = await self._make_request(
+            HTTPMethods.GET, endpoint, headers=headers or None
+        )
+        return _resolve_user(
+            self._user_cache,
+            cache_key,
+            cached,
+            response,
+            endpoint,
+            type(self).__name__,
+        )
+
+    # User Management Methods
+
+    async def userinfo(
+        self, token: Optional[str] = None, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
+        """
+        Get the user info.
+
+        Args:
+            token: Optional user access token, sent as a per-request Bearer
+                header instead of the client's own credentials
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            UserResponse object, or the response dict if raw is True
+        """
+        if not raw:
+            return await self._get_user_response("/userinfo", token)
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        response = await self._make_request(
+            HTTPMethods.GET, "/userinfo", headers=headers
+        )
+        return json.loads(response.content)
+
+    async def get_user(
+        self, user_id: Optional[str] = None, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
+        """
+        Get a user.
+
+        Args:
+            user_id: Optional ID of the user to retrieve. If omitted, returns
+                the user associated with the current token.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            UserResponse object, or the response dict if raw is True
+
+        Raises:
+            IdentiesNotFoundError: If client is not found
+        """
+        endpoint = f"/users/{user_id}" if user_id else "/user"
+        if not raw:
+            return await self._get_user_response(endpoint)
+        response = await self._make_request(HTTPMethods.GET, endpoint)
+        return json.loads(response.content)
+
+    async def get_me(self, raw: bool = False) -> Union[UserResponse, dict[str, Any]]:
+        """
+        Get the currently authenticated user.
+
+        Args:
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            UserResponse object, or the response dict if raw is True
+        """
+        response = await self._make_request(HTTPMethods.GET, "/me")
+        if raw:
+            return json.loads(response.content)
+        return UserResponse.model_validate_json(response.content)
+
+    async def get_internal_user(
+        self, user_id: str, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
+        """
+        Get an internal user.
+
+        Args:
+            user_id: ID of the user to retrieve.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            UserResponse object, or the response dict if raw is True
+
+        Raises:
+            IdentiesNotFoundError: If client is not found
+        """
+        endpoint = f"/internal/users/{user_id}"
+        response = await self._make_request(HTTPMethods.GET, endpoint)
+        if raw:
+            return json.loads(response.content)
+        return UserResponse.model_validate_json(response.content)
+
+    async def introspect(
+        self, api_key: Optional[str] = None, raw: bool = False
+    ) -> Union[IntrospectResponse, dict[str, Any]]:
+        """
+        Introspect a token.
+
+        Args:
+            api_key: Optional API key (or JWT) to introspect, sent as a
+                per-request Bearer header. If omitted, the client's own
+                credentials are used.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            IntrospectResponse object, or the response dict if raw is True
+        """
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        response = await self._make_request(
+            HTTPMethods.POST, "/api-keys/introspect", headers=headers
+        )
+        if raw:
+            return json.loads(response.content)
+        return IntrospectResponse.model_validate_json(response.content)
+
+    # External Accounts Methods
+
+    async def create_link_token(
+        self,
+        platform: str,
+        external_user_id: str,
+        data: Optional[dict[str, Any]] = None,
+        expires_in_seconds: int = 600,
+        raw: bool = False,
+    ) -> Union[LinkTokenResponse, dict[str, Any]]:
+        """
+        Create a short-lived, single-use link token.
+
+        Intended for backend/webhook use (e.g. external platform creates token
+        when user starts linking). Protect this endpoint at network or with
+        API key if needed.
+
+        Args:
+            platform: External platform (e.g. telegram).
+            external_user_id: External platform user id.
+            data: Optional payload to store with the linked account.
+            expires_in_seconds: Token TTL in seconds; default 10 minutes.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            LinkTokenResponse with token and expires_at, or the response dict
+            if raw is True.
+        """
+        body: dict[str, Any] = {
+            "platform": platform,
+            "external_user_id": external_user_id,
+        }
+        if data is not None:
+            body["data"] = data
+        if expires_in_seconds != 600:
+            body["expires_in_seconds"] = expires_in_seconds
+        response = await self._make_request(
+            HTTPMethods.POST,
+            "/external-accounts/link-tokens",
+            data=body,
+        )
+        if raw:
+            return json.loads(response.content)
+        return LinkTokenResponse.model_validate_json(response.content)
+
+    async def list_external_accounts(
+        self,
+        platform: Optional[str] = None,
+        page: int = 1,
+        size: int = 50,
+        raw: bool = False,
+    ) -> Union[ExternalAccountPageResponse, dict[str, Any]]:
+        """
+        List external accounts for the current user (paginated).
+
+        Args:
+            platform: Optional filter by platform (e.g. telegram).
+            page: Page number (1-based).
+            size: Number of items per page.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            ExternalAccountPageResponse with items, total, page, size, pages,
+            or the response dict if raw is True.
+        """
+        params: dict[str, int | str] = {"page": page, "size": size}
+        if platform is not None:
+            params["platform"] = platform
+        response = await self._make_request(
+            HTTPMethods.GET,
+            "/external-accounts",
+            params=params,
+        )
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountPageResponse.model_validate_json(response.content)
+
+    async def list_user_external_accounts(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        page: int = 1,
+        size: int = 50,
+        raw: bool = False,
+    ) -> Union[ExternalAccountPageResponse, dict[str, Any]]:
+        """
+        List external accounts for a specific user (paginated).
+
+        Args:
+            user_id: ID of the user whose external accounts to list.
+            platform: Optional filter by platform (e.g. telegram).
+            page: Page number (1-based).
+            size: Number of items per page.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            ExternalAccountPageResponse with items, total, page, size, pages,
+            or the response dict if raw is True.
+        """
+        params: dict[str, int | str] = {"page": page, "size": size}
+        if platform is not None:
+            params["platform"] = platform
+        response = await self._make_request(
+            HTTPMethods.GET,
+            f"/users/{user_id}/external-accounts",
+            params=params,
+        )
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountPageResponse.model_validate_json(response.content)
+
+    async def iter_external_accounts(
+        self,
+        user_id: Optional[str] = None,
+        platform: Optional[str] = None,
+        size: int = 50,
+    ) -> AsyncIterator[ExternalAccountResponse]:
+        """
+        Iterate over all external accounts, fetching one page at a time.
+
+        Only the current page is held in memory, and the first items are
+        available as soon as the first page arrives.
+
+        Args:
+            user_id: Optional ID of the user whose external accounts to list;
+                defaults to the current user.
+            platform: Optional filter by platform (e.g. telegram).
+            size: Number of items fetched per page.
+
+        Yields:
+            ExternalAccountResponse objects, in server order.
+        """
+        page = 1
+        while True:
+            if user_id is None:
+                result = await self.list_external_accounts(
+                    platform=platform, page=page, size=size
+                )
+            else:
+                result = await self.list_user_external_accounts(
+                    user_id, platform=platform, page=page, size=size
+                )
+            for item in result.items:
+                yield item
+            if not result.items or page >= result.pages:
+                return
+            page += 1
+
+    async def check_external_account(
+        self, platform: str, external_id: str, raw: bool = False
+    ) -> Union[CheckResponse, dict[str, Any]]:
+        """
+        Check if an external account (platform + external_id) is linked to a user.
+
+        Args:
+            platform: External platform (e.g. telegram).
+            external_id: External platform user id.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            CheckResponse with linked status, user, and external_accounts when
+            found, or the response dict if raw is True.
+        """
+        response = await self._make_request(
+            HTTPMethods.POST,
+            "/external-accounts/check",
+            data={"platform": platform, "external_id": external_id},
+        )
+        if raw:
+            return json.loads(response.content)
+        return CheckResponse.model_validate_json(response.content)
+
+    async def link_external_account(
+        self, token: str, raw: bool = False
+    ) -> Union[ExternalAccountResponse, dict[str, Any]]:
+        """
+        Link the current user to the external account referenced by the token.
+
+        Args:
+            token: The short-lived link token from the external platform.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
+        Returns:
+            ExternalAccountResponse for the linked account, or the response
+            dict if raw is True.
+        """
+        response = await self._make_request(
+            HTTPMethods.POST,
+            "/external-accounts/link",
+            data={"token": token},
+        )
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountResponse.model_validate_json(response.content)
+
+    async def delete_external_account(self, external_account_id: str) -> None:
+        """
+        Unlink an external account. Only the owner can delete.
+
+        Args:
+            external_account_id: UUID of the external account to delete.
+        """
+        await self._make_request(
+            HTTPMethods.DELETE,
+            f"/external-accounts/{external_account_id}",
+        )
+
+    async def get_token(
+        self,
+        client_id: str,
+        client_secret: str,
+        audience: str,
+    ) -> OAuthTokenResponse:
+        """
+        Obtain an access token using the OAuth 2.0 client_credentials grant (POST /oauth/token).
+
+        Authenticates with ``client_id`` and ``client_secret`` in the request body;
+        the server does not require a Bearer token for this path.
+
+        Args:
+            client_id: Registered OAuth client id.
+            client_secret: Client secret.
+            audience: Target audience for the minted JWT (must be allowed by the server).
+
+        Returns:
+            OAuthTokenResponse with access_token, token_type, and expires_in.
+        """
+        response = await self._make_request(
+            HTTPMethods.POST,
+            "/oauth/token",
+            data={
+                "grant_type": "client_credentials",
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "audience": audience,
+            },
+        )
+        return OAuthTokenResponse.model_validate_json(response.content)
+
+    async def exchange_token(
+        self,
+        user_id: str,
+        requested_audience: str,
+        requested_scope: str | list[str],
+        context: Optional[dict[str, Any]] = None,
+    ) -> TokenExchangeResponse:
+        """
+        Exchange a service account token for a delegated access token.
+
+        Args:
+            user_id: Internal user id to act on behalf of.
+            requested_audience: Target audience for the token.
+            requested_scope: Requested scopes (space-delimited string or list).
+            context: Optional metadata for audit/logging.
+        """
+        body: dict[str, Any] = {
+            "user_id": user_id,
+            "requested_audience": requested_audience,
+            "requested_scope": requested_scope,
+        }
+        if context is not None:
+            body["context"] = context
+        response = await self._make_request(
+            HTTPMethods.POST,
+            "/oauth/token-exchange",
+            data=body,
+        )
+        return TokenExchangeResponse.model_validate_json(response.content)
@@ -2,11 +2,15 @@
 Main Identies client for interacting with the Identies API.
 """
 
+import hashlib
+import json
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Iterator, Optional, Union
 import requests
 
 from .._base.client import BaseClient
+from .._base.exceptions import TesseraError
 from ...constants import HTTPMethods
 from .schemas.external_account_response import (
     CheckResponse,
@@ -19,9 +23,89 @@ from .schemas.oauth_token_response import OAuthTokenResponse
 from .schemas.token_exchange_response import TokenExchangeResponse
 from .schemas.user_response import UserResponse
 from ...config import get_settings
+from ...utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Bounds for each client's LRU cache of user responses revalidated with
+# If-None-Match / If-Modified-Since.
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 3600
+
+
+def _user_cache_key(endpoint: str, token: Optional[str]) -> tuple[str, bytes]:
+    """Return the cache key for a user endpoint fetched with token (or none)."""
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest() if token else b""
+    return endpoint, digest
+
+
+def _conditional_headers(response) -> Optional[dict[str, str]]:
+    """
+    Return the request headers that revalidate a response, if it has validators.
+
+    Args:
+        response: HTTP response (requests or httpx)
+
+    Returns:
+        If-None-Match and/or If-Modified-Since headers built from the response
+        ETag and Last-Modified, or None if it has neither
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers or None
+
+
+def _resolve_user(
+    cache,
+    cache_key: tuple[str, bytes],
+    cached,
+    response,
+    endpoint: str,
+    class_name: str,
+) -> UserResponse:
+    """
+    Return the UserResponse for a user endpoint response, updating the cache.
+
+    Callers always get their own copy, so mutating a result cannot affect
+    the cached model or other callers.
+
+    Args:
+        cache: Per-client TTLCache of (validators, UserResponse) entries
+        cache_key: Key from _user_cache_key
+        cached: The entry whose validators were sent, or None
+        response: Successful (2xx or 304) HTTP response
+        endpoint: API endpoint path, used in error messages
+        class_name: Name of the calling client class, used in error messages
+
+    Returns:
+        The cached user on 304 Not Modified, otherwise the parsed user
+
+    Raises:
+        TesseraError: If the server answers 304 to an unconditional request
+    """
+    if response.status_code == 304:
+        if cached is None:
+            raise TesseraError(
+                f"[{class_name}] {endpoint}: 304 Not Modified without a cached response",
+                304,
+            )
+        return cached[1].model_copy()
+
+    user = UserResponse.model_validate_json(response.content)
+    validators = _conditional_headers(response)
+    if validators is None:
+        cache.delete(cache_key)
+    else:
+        cache.set(
+            cache_key, (validators, user.model_copy()), time.time() + USER_CACHE_TTL
+        )
+    return user
+
 
 class IdentiesClient(BaseClient):
     """
@@ -54,81 +138,152 @@ class IdentiesClient(BaseClient):
             service_name="identies",
         )
 
+        # Last user response per endpoint and token, with its ETag /
+        # Last-Modified validators, copied out on 304 Not Modified.
+        self._user_cache = TTLCache(maxsize=USER_CACHE_SIZE)
+
+    def _get_user_response(
+        self, endpoint: str, token: Optional[str] = None
+    ) -> UserResponse:
+        """
+        GET a user endpoint, revalidating a previously cached response.
+
+        Args:
+            endpoint: User endpoint path (e.g., "/userinfo")
+            token: Optional user access token sent as a Bearer header
+
+        Returns:
+            UserResponse object
+        """
+        cache_key = _user_cache_key(endpoint, token)
+        cached = self._user_cache.get(cache_key)
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if cached is not None:
+            headers.update(cached[0])
+        response = self._make_request(
+            HTTPMethods.GET, endpoint, headers=headers or None
+        )
+        return _resolve_user(
+            self._user_cache,
+            cache_key,
+            cached,
+            response,
+            endpoint,
+            type(self).__name__,
+        )
+
     # User Management Methods
 
-    def userinfo(self) -> UserResponse:
+    def userinfo(
+        self, token: Optional[str] = None, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
         """
         Get the user info.
 
         Args:
-            None
+            token: Optional user access token, sent as a per-request Bearer
+                header instead of the client's own credentials
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            UserInfo object
+            UserResponse object, or the response dict if raw is True
         """
-        response = self._make_request(HTTPMethods.GET, "/userinfo")
-        return UserResponse(**response.json())
-
-    def get_user(self, user_id: Optional[str] = None) -> UserResponse:
+        if not raw:
+            return self._get_user_response("/userinfo", token)
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        response = self._make_request(HTTPMethods.GET, "/userinfo", headers=headers)
+        return json.loads(response.content)
+
+    def get_user(
+        self, user_id: Optional[str] = None, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
         """
         Get a user.
 
         Args:
             user_id: Optional ID of the user to retrieve. If omitted, returns
                 the user associated with the current token.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            UserResponse object
+            UserResponse object, or the response dict if raw is True
 
         Raises:
             IdentiesNotFoundError: If client is not found
         """
         endpoint = f"/users/{user_id}" if user_id else "/user"
+        if not raw:
+            return self._get_user_response(endpoint)
         response = self._make_request(HTTPMethods.GET, endpoint)
-        return UserResponse(**response.json())
+        return json.loads(response.content)
 
-    def get_me(self) -> UserResponse:
+    def get_me(self, raw: bool = False) -> Union[UserResponse, dict[str, Any]]:
         """
         Get the currently authenticated user.
 
+        Args:
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
+
         Returns:
-            UserResponse object
+            UserResponse object, or the response dict if raw is True
         """
         response = self._make_request(HTTPMethods.GET, "/me")
-        return UserResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return UserResponse.model_validate_json(response.content)
 
-    def get_internal_user(self, user_id: str) -> UserResponse:
+    def get_internal_user(
+        self, user_id: str, raw: bool = False
+    ) -> Union[UserResponse, dict[str, Any]]:
         """
         Get an internal user.
 
         Args:
             user_id: ID of the user to retrieve.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            UserResponse object
+            UserResponse object, or the response dict if raw is True
 
         Raises:
             IdentiesNotFoundError: If client is not found
         """
         endpoint = f"/internal/users/{user_id}"
         response = self._make_request(HTTPMethods.GET, endpoint)
-        return UserResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return UserResponse.model_validate_json(response.content)
 
-    def introspect(self) -> IntrospectResponse:
+    def introspect(
+        self, api_key: Optional[str] = None, raw: bool = False
+    ) -> Union[IntrospectResponse, dict[str, Any]]:
         """
         Introspect a token.
 
         Args:
-            None
+            api_key: Optional API key (or JWT) to introspect. It is sent as a
+                per-request Bearer header, so the shared session is never
+                mutated. If omitted, the client's own credentials are used.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            IntrospectResponse object
+            IntrospectResponse object, or the response dict if raw is True
 
         Raises:
             IdentiesNotFoundError: If client is not found
         """
-        response = self._make_request(HTTPMethods.POST, "/api-keys/introspect")
-        return IntrospectResponse(**response.json())
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        response = self._make_request(
+            HTTPMethods.POST, "/api-keys/introspect", headers=headers
+        )
+        if raw:
+            return json.loads(response.content)
+        return IntrospectResponse.model_validate_json(response.content)
 
     # External Accounts Methods
 
@@ -138,7 +293,8 @@ class IdentiesClient(BaseClient):
         external_user_id: str,
         data: Optional[dict[str, Any]] = None,
         expires_in_seconds: int = 600,
-    ) -> LinkTokenResponse:
+        raw: bool = False,
+    ) -> Union[LinkTokenResponse, dict[str, Any]]:
         """
         Create a short-lived, single-use link token.
 
@@ -151,9 +307,12 @@ class IdentiesClient(BaseClient):
             external_user_id: External platform user id.
             data: Optional payload to store with the linked account.
             expires_in_seconds: Token TTL in seconds; default 10 minutes.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            LinkTokenResponse with token and expires_at.
+            LinkTokenResponse with token and expires_at, or the response dict
+            if raw is True.
         """
         body: dict[str, Any] = {
             "platform": platform,
@@ -168,14 +327,17 @@ class IdentiesClient(BaseClient):
             "/external-accounts/link-tokens",
             data=body,
         )
-        return LinkTokenResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return LinkTokenResponse.model_validate_json(response.content)
 
     def list_external_accounts(
         self,
         platform: Optional[str] = None,
         page: int = 1,
         size: int = 50,
-    ) -> ExternalAccountPageResponse:
+        raw: bool = False,
+    ) -> Union[ExternalAccountPageResponse, dict[str, Any]]:
         """
         List external accounts for the current user (paginated).
 
@@ -183,9 +345,12 @@ class IdentiesClient(BaseClient):
             platform: Optional filter by platform (e.g. telegram).
             page: Page number (1-based).
             size: Number of items per page.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            ExternalAccountPageResponse with items, total, page, size, pages.
+            ExternalAccountPageResponse with items, total, page, size, pages,
+            or the response dict if raw is True.
         """
         params: dict[str, int | str] = {"page": page, "size": size}
         if platform is not None:
@@ -195,7 +360,9 @@ class IdentiesClient(BaseClient):
             "/external-accounts",
             params=params,
         )
-        return ExternalAccountPageResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountPageResponse.model_validate_json(response.content)
 
     def list_user_external_accounts(
         self,
@@ -203,7 +370,8 @@ class IdentiesClient(BaseClient):
         platform: Optional[str] = None,
         page: int = 1,
         size: int = 50,
-    ) -> ExternalAccountPageResponse:
+        raw: bool = False,
+    ) -> Union[ExternalAccountPageResponse, dict[str, Any]]:
         """
         List external accounts for a specific user (paginated).
 
@@ -212,9 +380,12 @@ class IdentiesClient(BaseClient):
             platform: Optional filter by platform (e.g. telegram).
             page: Page number (1-based).
             size: Number of items per page.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            ExternalAccountPageResponse with items, total, page, size, pages.
+            ExternalAccountPageResponse with items, total, page, size, pages,
+            or the response dict if raw is True.
         """
         params: dict[str, int | str] = {"page": page, "size": size}
         if platform is not None:
@@ -224,42 +395,95 @@ class IdentiesClient(BaseClient):
             f"/users/{user_id}/external-accounts",
             params=params,
         )
-        return ExternalAccountPageResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountPageResponse.model_validate_json(response.content)
+
+    def iter_external_accounts(
+        self,
+        user_id: Optional[str] = None,
+        platform: Optional[str] = None,
+        size: int = 50,
+    ) -> Iterator[ExternalAccountResponse]:
+        """
+        Iterate over all external accounts, fetching one page at a time.
 
-    def check_external_account(self, platform: str, external_id: str) -> CheckResponse:
+        Only the current page is held in memory, and the first items are
+        available as soon as the first page arrives.
+
+        Args:
+            user_id: Optional ID of the user whose external accounts to list;
+                defaults to the current user.
+            platform: Optional filter by platform (e.g. telegram).
+            size: Number of items fetched per page.
+
+        Yields:
+            ExternalAccountResponse objects, in server order.
+        """
+        page = 1
+        while True:
+            if user_id is None:
+                result = self.list_external_accounts(
+                    platform=platform, page=page, size=size
+                )
+            else:
+                result = self.list_user_external_accounts(
+                    user_id, platform=platform, page=page, size=size
+                )
+            for item in result.items:
+                yield item
+            if not result.items or page >= result.pages:
+                return
+            page += 1
+
+    def check_external_account(
+        self, platform: str, external_id: str, raw: bool = False
+    ) -> Union[CheckResponse, dict[str, Any]]:
         """
         Check if an external account (platform + external_id) is linked to a user.
 
         Args:
             platform: External platform (e.g. telegram).
             external_id: External platform user id.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            CheckResponse with linked status, user, and external_accounts when found.
+            CheckResponse with linked status, user, and external_accounts when
+            found, or the response dict if raw is True.
         """
         response = self._make_request(
             HTTPMethods.POST,
             "/external-accounts/check",
             data={"platform": platform, "external_id": external_id},
         )
-        return CheckResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return CheckResponse.model_validate_json(response.content)
 
-    def link_external_account(self, token: str) -> ExternalAccountResponse:
+    def link_external_account(
+        self, token: str, raw: bool = False
+    ) -> Union[ExternalAccountResponse, dict[str, Any]]:
         """
         Link the current user to the external account referenced by the token.
 
         Args:
             token: The short-lived link token from the external platform.
+            raw: If True, return the decoded JSON dict without building the
+                response model (for callers that only forward it)
 
         Returns:
-            ExternalAccountResponse for the linked account.
+            ExternalAccountResponse for the linked account, or the response
+            dict if raw is True.
         """
         response = self._make_request(
             HTTPMethods.POST,
             "/external-accounts/link",
             data={"token": token},
         )
-        return ExternalAccountResponse(**response.json())
+        if raw:
+            return json.loads(response.content)
+        return ExternalAccountResponse.model_validate_json(response.content)
 
     def delete_external_account(self, external_account_id: str) -> None:
         """
@@ -303,7 +527,7 @@ class IdentiesClient(BaseClient):
                 "audience": audience,
             },
         )
-        return OAuthTokenResponse(**response.json())
+        return OAuthTokenResponse.model_validate_json(response.content)
 
     def exchange_token(
         self,
@@ -333,4 +557,4 @@ class IdentiesClient(BaseClient):
             "/oauth/token-exchange",
             data=body,
         )
-        return TokenExchangeResponse(**response.json())
+        return TokenExchangeResponse.model_validate_json(response.content)
@@ -15,34 +15,34 @@ from .._base.exceptions import (
 class IdentiesError(TesseraError):
     """Base exception for all Identies-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class IdentiesClientError(TesseraClientError):
     """Exception raised for client-side errors (4xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class IdentiesServerError(TesseraServerError):
     """Exception raised for server-side errors (5xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class IdentiesAuthenticationError(TesseraAuthenticationError):
     """Exception raised for authentication errors (401 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class IdentiesNotFoundError(TesseraNotFoundError):
     """Exception raised when a resource is not found (404 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class IdentiesValidationError(TesseraValidationError):
     """Exception raised for validation errors (400 status code)."""
 
-    pass
+    __slots__ = ()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -10,8 +10,8 @@ class UserResponse(BaseModel):
     id: UUID
     """Unique identifier for the user in the database."""
 
-    email: Optional[EmailStr] = None
-    """User's email address. Must be a valid email format."""
+    email: Optional[str] = None
+    """User's email address, as validated by Identies (not re-checked here)."""
 
     preferred_name: Optional[str] = None
     """User's preferred name. Can be used for display."""
@@ -28,9 +28,6 @@ class UserResponse(BaseModel):
     last_name: str
     """User's last name. Required field."""
 
-    preferred_name: Optional[str] = None
-    """User's preferred name. Can be used for display."""
-
     provider: Optional[str] = None
     """Authentication provider (e.g., 'google', 'github', etc.) if user signed up via OAuth."""
 
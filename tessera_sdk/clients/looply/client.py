@@ -5,6 +5,7 @@ Main Looply client for interacting with the Looply API.
 import logging
 from typing import Any, Optional
 import requests
+from pydantic import TypeAdapter
 
 from .._base.client import BaseClient
 from ...constants import HTTPMethods
@@ -35,6 +36,12 @@ from .schemas.waiting_list import (
 
 logger = logging.getLogger(__name__)
 
+# Validators for list responses, so the JSON body is decoded and validated
+# in a single pass instead of via response.json() and per-item models.
+_CONTACTS = TypeAdapter(list[Contact])
+_CONTACT_LISTS = TypeAdapter(list[ContactList])
+_WAITING_LISTS = TypeAdapter(list[WaitingList])
+
 
 class LooplyClient(BaseClient):
     """
@@ -87,7 +94,7 @@ class LooplyClient(BaseClient):
             "/contacts",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return Contact(**response.json())
+        return Contact.model_validate_json(response.content)
 
     def batch_create_contacts(
         self, requests_list: list[ContactCreateRequest]
@@ -106,7 +113,7 @@ class LooplyClient(BaseClient):
             "/contacts/batch",
             data=[r.model_dump(mode="json", exclude_none=True) for r in requests_list],
         )
-        return [Contact(**item) for item in response.json()]
+        return _CONTACTS.validate_json(response.content)
 
     def list_contacts(self, page: int = 1, size: int = 50) -> dict[str, Any]:
         """
@@ -159,7 +166,7 @@ class LooplyClient(BaseClient):
             LooplyNotFoundError: If contact is not found.
         """
         response = self._make_request(HTTPMethods.GET, f"/contacts/{contact_id}")
-        return Contact(**response.json())
+        return Contact.model_validate_json(response.content)
 
     def update_contact(self, contact_id: str, request: ContactUpdate) -> Contact:
         """
@@ -180,7 +187,7 @@ class LooplyClient(BaseClient):
             f"/contacts/{contact_id}",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return Contact(**response.json())
+        return Contact.model_validate_json(response.content)
 
     def delete_contact(self, contact_id: str) -> None:
         """
@@ -210,7 +217,7 @@ class LooplyClient(BaseClient):
             "/contact-lists",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return ContactList(**response.json())
+        return ContactList.model_validate_json(response.content)
 
     def list_contact_lists(self, page: int = 1, size: int = 50) -> dict[str, Any]:
         """
@@ -282,7 +289,7 @@ class LooplyClient(BaseClient):
         response = self._make_request(
             HTTPMethods.GET, f"/contact-lists/{contact_list_id}"
         )
-        return ContactList(**response.json())
+        return ContactList.model_validate_json(response.content)
 
     def update_contact_list(
         self, contact_list_id: str, request: ContactListUpdate
@@ -302,7 +309,7 @@ class LooplyClient(BaseClient):
             f"/contact-lists/{contact_list_id}",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return ContactList(**response.json())
+        return ContactList.model_validate_json(response.content)
 
     def delete_contact_list(self, contact_list_id: str) -> None:
         """
@@ -403,7 +410,7 @@ class LooplyClient(BaseClient):
             HTTPMethods.GET,
             f"/contact-lists/contacts/{contact_id}/contact-lists",
         )
-        return [ContactList(**item) for item in response.json()]
+        return _CONTACT_LISTS.validate_json(response.content)
 
     def is_contact_list_member(
         self, contact_list_id: str, contact_id: str
@@ -472,7 +479,7 @@ class LooplyClient(BaseClient):
             f"/contacts/{contact_id}/interactions",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return ContactInteraction(**response.json())
+        return ContactInteraction.model_validate_json(response.content)
 
     def list_contact_interactions(
         self, contact_id: str, page: int = 1, size: int = 50
@@ -565,7 +572,7 @@ class LooplyClient(BaseClient):
         response = self._make_request(
             HTTPMethods.GET, f"/contact-interactions/{interaction_id}"
         )
-        return ContactInteraction(**response.json())
+        return ContactInteraction.model_validate_json(response.content)
 
     def update_interaction(
         self, interaction_id: str, request: ContactInteractionUpdate
@@ -585,7 +592,7 @@ class LooplyClient(BaseClient):
             f"/contact-interactions/{interaction_id}",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return ContactInteraction(**response.json())
+        return ContactInteraction.model_validate_json(response.content)
 
     def delete_interaction(self, interaction_id: str) -> None:
         """
@@ -617,7 +624,7 @@ class LooplyClient(BaseClient):
             "/waiting-lists",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return WaitingList(**response.json())
+        return WaitingList.model_validate_json(response.content)
 
     def list_waiting_lists(self, page: int = 1, size: int = 50) -> dict[str, Any]:
         """
@@ -653,7 +660,7 @@ class LooplyClient(BaseClient):
         response = self._make_request(
             HTTPMethods.GET, f"/waiting-lists/{waiting_list_id}"
         )
-        return WaitingList(**response.json())
+        return WaitingList.model_validate_json(response.content)
 
     def update_waiting_list(
         self, waiting_list_id: str, request: WaitingListUpdate
@@ -673,7 +680,7 @@ class LooplyClient(BaseClient):
             f"/waiting-lists/{waiting_list_id}",
             data=request.model_dump(mode="json", exclude_none=True),
         )
-        return WaitingList(**response.json())
+        return WaitingList.model_validate_json(response.content)
 
     def delete_waiting_list(self, waiting_list_id: str) -> None:
         """
@@ -857,7 +864,7 @@ class LooplyClient(BaseClient):
             HTTPMethods.GET,
             f"/waiting-lists/contacts/{contact_id}/waiting-lists",
         )
-        return [WaitingList(**item) for item in response.json()]
+        return _WAITING_LISTS.validate_json(response.content)
 
     def is_waiting_list_member(
         self, waiting_list_id: str, contact_id: str
@@ -15,34 +15,34 @@ from .._base.exceptions import (
 class LooplyError(TesseraError):
     """Base exception for all Looply-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class LooplyClientError(TesseraClientError):
     """Exception raised for client-side errors (4xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class LooplyServerError(TesseraServerError):
     """Exception raised for server-side errors (5xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class LooplyAuthenticationError(TesseraAuthenticationError):
     """Exception raised for authentication errors (401 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class LooplyNotFoundError(TesseraNotFoundError):
     """Exception raised when a resource is not found (404 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class LooplyValidationError(TesseraValidationError):
     """Exception raised for validation errors (400 status code)."""
 
-    pass
+    __slots__ = ()
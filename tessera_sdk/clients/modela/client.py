@@ -53,7 +53,7 @@ class ModelaClient(BaseClient):
             data=request.model_dump(mode="json", exclude_none=True),
             params={"project_id": project_id},
         )
-        return ChatCompletionResponse(**response.json())
+        return ChatCompletionResponse.model_validate_json(response.content)
 
     def scan_file(
         self,
@@ -73,7 +73,7 @@ class ModelaClient(BaseClient):
             data=request.model_dump(mode="json", exclude_none=True),
             params={"project_id": project_id},
         )
-        return ScanResponse(**response.json())
+        return ScanResponse.model_validate_json(response.content)
 
     def summarize_text(
         self,
@@ -91,7 +91,7 @@ class ModelaClient(BaseClient):
             data=request.model_dump(mode="json", exclude_none=True),
             params={"project_id": project_id},
         )
-        return SummarizeResponse(**response.json())
+        return SummarizeResponse.model_validate_json(response.content)
 
     def summarize_file(
         self,
@@ -111,4 +111,4 @@ class ModelaClient(BaseClient):
             data=request.model_dump(mode="json", exclude_none=True),
             params={"project_id": project_id},
         )
-        return SummarizeResponse(**response.json())
+        return SummarizeResponse.model_validate_json(response.content)
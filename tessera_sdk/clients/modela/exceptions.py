@@ -9,24 +9,24 @@ from .._base.exceptions import (
 
 
 class ModelaError(TesseraError):
-    pass
+    __slots__ = ()
 
 
 class ModelaClientError(TesseraClientError):
-    pass
+    __slots__ = ()
 
 
 class ModelaServerError(TesseraServerError):
-    pass
+    __slots__ = ()
 
 
 class ModelaAuthenticationError(TesseraAuthenticationError):
-    pass
+    __slots__ = ()
 
 
 class ModelaNotFoundError(TesseraNotFoundError):
-    pass
+    __slots__ = ()
 
 
 class ModelaValidationError(TesseraValidationError):
-    pass
+    __slots__ = ()
@@ -65,4 +65,4 @@ class QuoreClient(BaseClient):
         response = self._make_request(
             HTTPMethods.POST, endpoint, data=request_data.model_dump()
         )
-        return SummarizeResponse(**response.json())
+        return SummarizeResponse.model_validate_json(response.content)
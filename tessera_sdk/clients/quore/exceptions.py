@@ -15,34 +15,34 @@ from .._base.exceptions import (
 class QuoreError(TesseraError):
     """Base exception for all Quore-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class QuoreClientError(TesseraClientError):
     """Exception raised for client-side errors (4xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class QuoreServerError(TesseraServerError):
     """Exception raised for server-side errors (5xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class QuoreAuthenticationError(TesseraAuthenticationError):
     """Exception raised for authentication errors (401 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class QuoreNotFoundError(TesseraNotFoundError):
     """Exception raised when a resource is not found (404 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class QuoreValidationError(TesseraValidationError):
     """Exception raised for validation errors (400 status code)."""
 
-    pass
+    __slots__ = ()
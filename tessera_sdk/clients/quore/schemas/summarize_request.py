@@ -17,7 +17,4 @@ class SummarizeRequest(BaseModel):
     labels: Optional[Dict[str, Any]] = None
     """Optional labels/metadata for the summarization request."""
 
-    class ConfigDict:
-        """Pydantic model configuration."""
-
-        from_attributes = True
+    model_config = {"from_attributes": True}
@@ -24,7 +24,4 @@ class SummarizeResponse(BaseModel):
     query: Optional[str] = None
     """Query used for the summarization."""
 
-    class ConfigDict:
-        """Pydantic model configuration."""
-
-        from_attributes = True
+    model_config = {"from_attributes": True}
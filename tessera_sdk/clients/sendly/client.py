@@ -70,7 +70,7 @@ class SendlyClient(BaseClient):
         response = self._make_request(
             HTTPMethods.POST, endpoint, data=request.model_dump(mode="json")
         )
-        return CreateEmailResponse(**response.json())
+        return CreateEmailResponse.model_validate_json(response.content)
 
     def send_broadcast(
         self,
@@ -95,7 +95,7 @@ class SendlyClient(BaseClient):
         response = self._make_request(
             HTTPMethods.POST, endpoint, data=request.model_dump(mode="json")
         )
-        return SendBroadcastResponse(**response.json())
+        return SendBroadcastResponse.model_validate_json(response.content)
 
     def get_broadcast(
         self,
@@ -120,4 +120,4 @@ class SendlyClient(BaseClient):
         params = {"project_id": project_id} if project_id else None
 
         response = self._make_request(HTTPMethods.GET, endpoint, params=params)
-        return GetBroadcastResponse(**response.json())
+        return GetBroadcastResponse.model_validate_json(response.content)
@@ -15,34 +15,34 @@ from .._base.exceptions import (
 class SendlyError(TesseraError):
     """Base exception for all Sendly-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class SendlyClientError(TesseraClientError):
     """Exception raised for client-side errors (4xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class SendlyServerError(TesseraServerError):
     """Exception raised for server-side errors (5xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class SendlyAuthenticationError(TesseraAuthenticationError):
     """Exception raised for authentication errors (401 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class SendlyNotFoundError(TesseraNotFoundError):
     """Exception raised when a resource is not found (404 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class SendlyValidationError(TesseraValidationError):
     """Exception raised for validation errors (400 status code)."""
 
-    pass
+    __slots__ = ()
@@ -56,4 +56,4 @@ class VaultaClient(BaseClient):
         """
         endpoint = f"/assets/{asset_id}"
         response = self._make_request(HTTPMethods.GET, endpoint)
-        return AssetResponse(**response.json())
+        return AssetResponse.model_validate_json(response.content)
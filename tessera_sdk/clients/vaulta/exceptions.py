@@ -15,34 +15,34 @@ from .._base.exceptions import (
 class VaultaError(TesseraError):
     """Base exception for all Vaulta-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class VaultaClientError(TesseraClientError):
     """Exception raised for client-side errors (4xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class VaultaServerError(TesseraServerError):
     """Exception raised for server-side errors (5xx status codes)."""
 
-    pass
+    __slots__ = ()
 
 
 class VaultaAuthenticationError(TesseraAuthenticationError):
     """Exception raised for authentication errors (401 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class VaultaNotFoundError(TesseraNotFoundError):
     """Exception raised when a resource is not found (404 status code)."""
 
-    pass
+    __slots__ = ()
 
 
 class VaultaValidationError(TesseraValidationError):
     """Exception raised for validation errors (400 status code)."""
 
-    pass
+    __slots__ = ()
@@ -61,7 +61,4 @@ class AssetResponse(AssetBase):
     updated_at: Optional[datetime] = None
     """Timestamp when the asset was last updated."""
 
-    class ConfigDict:
-        """Pydantic model configuration."""
-
-        from_attributes = True
+    model_config = {"from_attributes": True}
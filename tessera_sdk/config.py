@@ -1,67 +1,99 @@
 import json
-from pydantic import AliasChoices, Field
-from typing import Optional
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic import AliasChoices, Field, PrivateAttr, model_validator
+from typing import Literal, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",  # Allow extra environment variables
+        frozen=True,  # Settings are shared process-wide by get_settings()
+        validate_default=False,  # Defaults below are already well-typed
+        populate_by_name=True,
+    )
+
     redis_host: str = Field(
-        default="localhost", json_schema_extra={"env": "REDIS_HOST"}
+        default="localhost",
+        validation_alias=AliasChoices("REDIS_HOST", "redis_host"),
+    )
+    redis_port: int = Field(
+        default=6379,
+        validation_alias=AliasChoices("REDIS_PORT", "redis_port"),
     )
-    redis_port: int = Field(default=6379, json_schema_extra={"env": "REDIS_PORT"})
     redis_namespace: str = Field(
-        default="llama_index", json_schema_extra={"env": "REDIS_NAMESPACE"}
+        default="llama_index",
+        validation_alias=AliasChoices("REDIS_NAMESPACE", "redis_namespace"),
     )
     identies_api_url: str = Field(
         default="https://identies.tessera.com",
-        json_schema_extra={"env": "IDENTIES_API_URL"},
+        validation_alias=AliasChoices("IDENTIES_API_URL", "identies_api_url"),
     )
     identies_client_id: str = Field(
         default="",
-        json_schema_extra={"env": "IDENTIES_CLIENT_ID"},
+        validation_alias=AliasChoices("IDENTIES_CLIENT_ID", "identies_client_id"),
     )
     identies_client_secret: str = Field(
         default="",
-        json_schema_extra={"env": "IDENTIES_CLIENT_SECRET"},
+        validation_alias=AliasChoices(
+            "IDENTIES_CLIENT_SECRET", "identies_client_secret"
+        ),
     )
     identies_client_audience: str = Field(
         default="https://identies.tessera.com",
-        json_schema_extra={"env": "IDENTIES_CLIENT_AUDIENCE"},
+        validation_alias=AliasChoices(
+            "IDENTIES_CLIENT_AUDIENCE", "identies_client_audience"
+        ),
     )
     custos_api_url: str = Field(
         default="https://custos.tessera.com",
-        json_schema_extra={"env": "CUSTOS_API_URL"},
+        validation_alias=AliasChoices("CUSTOS_API_URL", "custos_api_url"),
     )
     sendly_api_url: str = Field(
         default="https://sendly.tessera.com",
-        json_schema_extra={"env": "SENDLY_API_URL"},
+        validation_alias=AliasChoices("SENDLY_API_URL", "sendly_api_url"),
     )
     looply_api_url: str = Field(
         default="https://looply.tessera.com",
-        json_schema_extra={"env": "LOOPLY_API_URL"},
+        validation_alias=AliasChoices("LOOPLY_API_URL", "looply_api_url"),
     )
     modela_api_url: str = Field(
         default="https://modela.tessera.com",
-        json_schema_extra={"env": "MODELA_API_URL"},
+        validation_alias=AliasChoices("MODELA_API_URL", "modela_api_url"),
     )
     authorization_cache_enabled: bool = Field(
         default=False,
-        json_schema_extra={"env": "AUTHORIZATION_CACHE_ENABLED"},
+        validation_alias=AliasChoices(
+            "AUTHORIZATION_CACHE_ENABLED", "authorization_cache_enabled"
+        ),
     )
     authorization_cache_ttl: int = Field(
         default=300,
-        json_schema_extra={"env": "AUTHORIZATION_CACHE_TTL"},
+        validation_alias=AliasChoices(
+            "AUTHORIZATION_CACHE_TTL", "authorization_cache_ttl"
+        ),
     )
     environment: str = Field(
         default="development",
         validation_alias=AliasChoices("ENV", "ENVIRONMENT"),
     )
-    log_level: str = Field(default="INFO", json_schema_extra={"env": "LOG_LEVEL"})
-    disable_auth: bool = Field(default=False, json_schema_extra={"env": "DISABLE_AUTH"})
-    port: int = Field(default=8000, json_schema_extra={"env": "PORT"})
+    log_level: str = Field(
+        default="INFO",
+        validation_alias=AliasChoices("LOG_LEVEL", "log_level"),
+    )
+    disable_auth: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("DISABLE_AUTH", "disable_auth"),
+    )
+    port: int = Field(
+        default=8000,
+        validation_alias=AliasChoices("PORT", "port"),
+    )
     identies_host: Optional[str] = Field(
         default=None,
-        json_schema_extra={"env": "IDENTIES_HOST"},
+        validation_alias=AliasChoices("IDENTIES_HOST", "identies_host"),
     )
 
     # Tessera SDK (namespaced) settings
@@ -82,45 +114,108 @@ class Settings(BaseSettings):
         ),
     )
 
+    tesserasdk_auth_middleware_http2: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            "TESSERASDK_AUTH_MIDDLEWARE_HTTP2",
+            "tesserasdk.auth_middleware.http2",
+        ),
+    )
+
+    tesserasdk_token_cache_size: int = Field(
+        default=4096,
+        validation_alias=AliasChoices(
+            "TESSERASDK_TOKEN_CACHE_SIZE",
+            "tesserasdk.token_cache.size",
+        ),
+    )
+
+    tesserasdk_token_cache_ttl: int = Field(
+        default=300,
+        validation_alias=AliasChoices(
+            "TESSERASDK_TOKEN_CACHE_TTL",
+            "tesserasdk.token_cache.ttl",
+        ),
+    )
+
     oidc_domain: str = "test.oidc.com"
     oidc_api_audience: str = "https://test-api"
     oidc_issuer: str = "https://test.oidc.com/"
     oidc_algorithms: str = "RS256"
     oidc_jwks_urls: Optional[str] = Field(
-        default=None, json_schema_extra={"env": "OIDC_JWKS_URLS"}
+        default=None,
+        validation_alias=AliasChoices("OIDC_JWKS_URLS", "oidc_jwks_urls"),
     )
     auth_providers_json: Optional[str] = Field(
-        default=None, json_schema_extra={"env": "AUTH_PROVIDERS_JSON"}
+        default=None,
+        validation_alias=AliasChoices("AUTH_PROVIDERS_JSON", "auth_providers_json"),
     )
 
     service_account_client_id: str = Field(
-        default="", json_schema_extra={"env": "SERVICE_ACCOUNT_CLIENT_ID"}
+        default="",
+        validation_alias=AliasChoices(
+            "SERVICE_ACCOUNT_CLIENT_ID", "service_account_client_id"
+        ),
     )
     service_account_client_secret: str = Field(
-        default="", json_schema_extra={"env": "SERVICE_ACCOUNT_CLIENT_SECRET"}
+        default="",
+        validation_alias=AliasChoices(
+            "SERVICE_ACCOUNT_CLIENT_SECRET", "service_account_client_secret"
+        ),
+    )
+    nats_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("NATS_ENABLED", "nats_enabled"),
     )
-    nats_enabled: bool = Field(default=False, json_schema_extra={"env": "NATS_ENABLED"})
     nats_url: str = Field(
-        default="nats://localhost:4222", json_schema_extra={"env": "NATS_URL"}
+        default="nats://localhost:4222",
+        validation_alias=AliasChoices("NATS_URL", "nats_url"),
+    )
+    # "msgpack" requires the optional ormsgpack package (tessera-sdk[msgpack]).
+    nats_wire_format: Literal["json", "msgpack"] = Field(
+        default="json",
+        validation_alias=AliasChoices("NATS_WIRE_FORMAT", "nats_wire_format"),
     )
     event_type_prefix: str = Field(
-        default="com.mylinden", json_schema_extra={"env": "EVENT_TYPE_PREFIX"}
+        default="com.mylinden",
+        validation_alias=AliasChoices("EVENT_TYPE_PREFIX", "event_type_prefix"),
     )
     event_source_prefix: str = Field(
-        default="linden-api", json_schema_extra={"env": "EVENT_SOURCE_PREFIX"}
+        default="linden-api",
+        validation_alias=AliasChoices("EVENT_SOURCE_PREFIX", "event_source_prefix"),
     )
 
+    _is_production: bool = PrivateAttr(default=False)
+    _is_test: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def _derive_environment_flags(self) -> "Settings":
+        """Resolve the environment checks once instead of on every access."""
+        environment = self.environment.lower()
+        self._is_production = environment == "production"
+        self._is_test = environment == "test"
+        return self
+
     @property
     def is_production(self) -> bool:
         """Check if the current environment is production."""
-        return self.environment.lower() == "production"
+        return self._is_production
 
     @property
     def is_test(self) -> bool:
         """Check if the current environment is test."""
-        return self.environment.lower() == "test"
+        return self._is_test
+
+    _oidc_jwks_urls: tuple[str, ...] = PrivateAttr(default=())
+    _oidc_algorithms: tuple[str, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def _parse_oidc_lists(self) -> "Settings":
+        """Split the comma-separated OIDC settings into tuples once."""
+        self._oidc_algorithms = tuple(
+            a.strip() for a in self.oidc_algorithms.split(",") if a.strip()
+        )
 
-    def get_oidc_jwks_urls(self) -> list[str]:
         if self.oidc_jwks_urls:
             urls = [v.strip() for v in self.oidc_jwks_urls.split(",") if v.strip()]
         else:
@@ -129,36 +224,59 @@ class Settings(BaseSettings):
                 urls.append(f"https://{self.oidc_domain}/.well-known/jwks.json")
             if self.identies_api_url:
                 urls.append(f"{self.identies_api_url}/.well-known/jwks.json")
-        return list(dict.fromkeys(urls))
+        seen: set[str] = set()
+        unique: list[str] = []
+        for url in urls:
+            if url not in seen:
+                seen.add(url)
+                unique.append(url)
+        self._oidc_jwks_urls = tuple(unique)
+        return self
 
-    def get_auth_providers(self) -> list[dict]:
-        """
-        Return auth providers with jwks_url, issuer, and audiences.
-        """
+    def get_oidc_jwks_urls(self) -> tuple[str, ...]:
+        """Return the de-duplicated JWKS URLs (immutable, shared by callers)."""
+        return self._oidc_jwks_urls
+
+    def get_oidc_algorithms(self) -> tuple[str, ...]:
+        """Return the accepted JWT signing algorithms from OIDC_ALGORITHMS."""
+        return self._oidc_algorithms
+
+    _auth_providers: list[dict] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _parse_auth_providers(self) -> "Settings":
+        """Parse AUTH_PROVIDERS_JSON (or build the OIDC default) once."""
         if self.auth_providers_json:
             providers = json.loads(self.auth_providers_json)
             if not isinstance(providers, list):
                 raise ValueError("AUTH_PROVIDERS_JSON must be a list")
-            return providers
+            self._auth_providers = providers
+            return self
 
         jwks_urls = self.get_oidc_jwks_urls()
-        if not jwks_urls:
-            return []
-
-        return [
-            {
-                "jwks_url": jwks_urls[0],
-                "issuer": self.oidc_issuer,
-                "audiences": [self.oidc_api_audience],
-            }
-        ]
+        if jwks_urls:
+            self._auth_providers = [
+                {
+                    "jwks_url": jwks_urls[0],
+                    "issuer": self.oidc_issuer,
+                    "audiences": [self.oidc_api_audience],
+                }
+            ]
+        return self
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "allow"  # Allow extra environment variables
+    def get_auth_providers(self) -> list[dict]:
+        """
+        Return auth providers with jwks_url, issuer, and audiences.
+        """
+        return [dict(provider) for provider in self._auth_providers]
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings with required environment variables."""
+    """
+    Get application settings with required environment variables.
+
+    Settings are read once per process; call get_settings.cache_clear() to
+    pick up environment changes (e.g. in tests).
+    """
     return Settings()
@@ -14,5 +14,8 @@ class HTTPMethods:
     HEAD = "HEAD"
     OPTIONS = "OPTIONS"
 
-    # Common method list (useful for validation / allowlists)
-    ALL_METHODS = [HEAD, GET, OPTIONS, POST, PUT, DELETE]
+    # Common methods in a stable order (e.g. for retry configuration)
+    ALL_METHODS_ORDERED = (HEAD, GET, OPTIONS, POST, PUT, DELETE)
+
+    # Common method set (useful for validation / allowlists)
+    ALL_METHODS = frozenset(ALL_METHODS_ORDERED)
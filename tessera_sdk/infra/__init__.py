@@ -10,6 +10,7 @@ from .m2m_token import (
     get_m2m_token_sync,
 )
 from .service_factory import ServiceFactory, create_service_factory
+from ..utils.ttl_cache import TTLCache
 
 __all__ = [
     "AuthTokenProvider",
@@ -25,4 +26,5 @@ __all__ = [
     "get_m2m_token_sync",
     "ServiceFactory",
     "create_service_factory",
+    "TTLCache",
 ]
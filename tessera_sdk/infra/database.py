@@ -5,9 +5,11 @@ This class encapsulates database engine creation, session management,
 and event listeners. It can be easily moved to a common package.
 """
 
+from functools import cached_property
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import (
+    scoped_session,
     sessionmaker,
 )
 from sqlalchemy.orm.session import Session as SessionType
@@ -47,25 +49,38 @@ class DatabaseManager:
         """
         self.database_url = database_url
         self.application_name = application_name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_recycle = pool_recycle
+        self.pool_use_lifo = pool_use_lifo
 
-        # Create engine
-        self.engine = create_engine(
-            database_url,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            pool_pre_ping=pool_pre_ping,
-            pool_recycle=pool_recycle,
-            pool_use_lifo=pool_use_lifo,
-            connect_args={"application_name": application_name},
+    @cached_property
+    def engine(self) -> Engine:
+        """Database engine, created and instrumented on first use."""
+        engine = create_engine(
+            self.database_url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=self.pool_pre_ping,
+            pool_recycle=self.pool_recycle,
+            pool_use_lifo=self.pool_use_lifo,
+            connect_args={"application_name": self.application_name},
         )
         SQLAlchemyInstrumentor().instrument(
-            engine=self.engine,
+            engine=engine,
         )
+        return engine
 
-        # Create session factory
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
-        )
+    @cached_property
+    def SessionLocal(self) -> sessionmaker:
+        """Session factory bound to the engine, created on first use."""
+        return sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+
+    @cached_property
+    def ScopedSession(self) -> scoped_session:
+        """Thread-local session registry for short-lived, non-request callers."""
+        return scoped_session(self.SessionLocal)
 
     def get_db(self) -> Generator[SessionType, None, None]:
         """
@@ -89,9 +104,28 @@ class DatabaseManager:
         """
         return self.SessionLocal()
 
+    def scoped(self) -> SessionType:
+        """
+        Return the current thread's session, creating it on first use.
+
+        Repeated calls on the same thread reuse one session until
+        remove_scoped() is called.
+
+        Returns:
+            Thread-local database session
+        """
+        return self.ScopedSession()
+
+    def remove_scoped(self):
+        """Close and discard the current thread's scoped session, if any."""
+        if "ScopedSession" in self.__dict__:
+            self.ScopedSession.remove()
+
     def dispose(self):
         """Dispose of the database engine and close all connections."""
-        self.engine.dispose()
+        # Avoid creating an engine just to dispose of it.
+        if "engine" in self.__dict__:
+            self.engine.dispose()
 
     @contextmanager
     def db_session(self):
@@ -1,4 +1,4 @@
-from .event import Event, event_type, event_source
+from .event import Event, event_type, event_source, refresh_event_settings
 from .nats_router import NatsEventPublisher, nats_router
 from .nats_healthcheck import NatsHealthcheck
 
@@ -6,6 +6,7 @@ __all__ = [
     "Event",
     "event_type",
     "event_source",
+    "refresh_event_settings",
     "NatsEventPublisher",
     "nats_router",
     "NatsHealthcheck",
@@ -1,9 +1,34 @@
-from datetime import datetime
-from typing import Any, Dict, Optional, Union, List
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import partial
+from typing import Annotated, Any, Dict, Literal, Optional, Union, List, Tuple
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator
 from uuid import UUID, uuid4
 from ...config import get_settings
 
+# Timezone-aware replacement for the deprecated datetime.utcnow.
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+def _event_data_kind(value: Any) -> str:
+    """Pick the event_data union branch from the payload's Python type."""
+    if isinstance(value, Mapping):
+        return "dict"
+    if isinstance(value, bytes):
+        return "bytes"
+    return "str"
+
+
+# Tagged so pydantic validates only the matching branch instead of trying each.
+EventData = Annotated[
+    Union[
+        Annotated[Dict[str, Any], Tag("dict")],
+        Annotated[str, Tag("str")],
+        Annotated[bytes, Tag("bytes")],
+    ],
+    Discriminator(_event_data_kind),
+]
+
 
 class Event(BaseModel):
     """
@@ -22,12 +47,16 @@ class Event(BaseModel):
     )
     source: str = Field(
         ...,
+        min_length=1,
         description="URI-reference that identifies the context in which an event happened",
     )
-    spec_version: str = Field(
+    # Only CloudEvents spec_version 1.0 is supported.
+    spec_version: Literal["1.0"] = Field(
         default="1.0", description="Version of the CloudEvents specification"
     )
-    event_type: str = Field(..., description="Type of occurrence which has happened")
+    event_type: str = Field(
+        ..., min_length=1, description="Type of occurrence which has happened"
+    )
 
     # Optional attributes
     data_content_type: Optional[str] = Field(
@@ -41,10 +70,10 @@ class Event(BaseModel):
         description="Describes the subject of the event in the context of the event producer",
     )
     time: Optional[datetime] = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Timestamp of when the occurrence happened",
     )
-    event_data: Optional[Union[Dict[str, Any], str, bytes]] = Field(
+    event_data: Optional[EventData] = Field(
         default=None, description="The event payload"
     )
     user_id: Optional[str] = Field(
@@ -69,29 +98,9 @@ class Event(BaseModel):
         description="Whether the event is private (extension attribute)",
     )
 
-    @field_validator("source")
-    @classmethod
-    def validate_source(cls, v):
-        """Validate that source is a valid URI-reference."""
-        if not v or not isinstance(v, str):
-            raise ValueError("Source must be a non-empty string")
-        return v
-
-    @field_validator("event_type")
-    @classmethod
-    def validate_type(cls, v):
-        """Validate that type is a valid event type."""
-        if not v or not isinstance(v, str):
-            raise ValueError("Type must be a non-empty string")
-        return v
-
-    @field_validator("spec_version")
-    @classmethod
-    def validate_spec_version(cls, v):
-        """Validate spec_version."""
-        if v != "1.0":
-            raise ValueError("Only CloudEvents spec_version 1.0 is supported")
-        return v
+    def to_json_bytes(self) -> bytes:
+        """Serialize the event to JSON bytes without an intermediate str or dict."""
+        return self.__pydantic_serializer__.to_json(self)
 
     @field_validator("time")
     @classmethod
@@ -121,13 +130,33 @@ class Event(BaseModel):
     )
 
 
+# Event prefixes read from settings on first use; see refresh_event_settings().
+_event_type_prefix: Optional[str] = None
+_event_source_prefix: Optional[str] = None
+
+
+def refresh_event_settings() -> None:
+    """Re-read the event type and source prefixes from settings."""
+    global _event_type_prefix, _event_source_prefix
+    settings = get_settings()
+    _event_type_prefix = settings.event_type_prefix
+    _event_source_prefix = settings.event_source_prefix
+
+
+def _event_prefixes() -> Tuple[str, str]:
+    """Return the event type and source prefixes, loading them on first use."""
+    if _event_type_prefix is None or _event_source_prefix is None:
+        refresh_event_settings()
+    return _event_type_prefix, _event_source_prefix
+
+
 def event_type(type: str) -> str:
     """Get the event type."""
-    settings = get_settings()
-    return f"{settings.event_type_prefix}.{type}"
+    type_prefix, _ = _event_prefixes()
+    return f"{type_prefix}.{type}"
 
 
 def event_source(source: Optional[str] = "") -> str:
     """Get the event source."""
-    settings = get_settings()
-    return f"/{settings.event_source_prefix}{source}"
+    _, source_prefix = _event_prefixes()
+    return f"/{source_prefix}{source}"
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
+from typing import Callable, Optional, Sequence
 
 from faststream.exceptions import IncorrectState  # type: ignore[import]
 from faststream.nats.fastapi import NatsRouter  # type: ignore[import]
@@ -18,13 +20,81 @@ settings = get_settings()
 
 nats_router = NatsRouter(settings.nats_url)
 
+# Payloads are published pre-encoded; bytes carry no content type by default.
+JSON_HEADERS = {"content-type": "application/json"}
+MSGPACK_HEADERS = {"content-type": "application/msgpack"}
+
+# broker.connect() only connects when no connection exists yet, but two
+# publishers awaiting it together would each open one; serialize them. An
+# asyncio.Lock binds to one loop and publish_blocking runs each call on a new
+# one, so keep a lock per event loop.
+_connect_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _connect_lock() -> asyncio.Lock:
+    """Return the connect lock for the running event loop, creating it on first use."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Not on an asyncio loop (e.g. a trio host); nothing to share a lock with.
+        return asyncio.Lock()
+    lock = _connect_locks.get(loop)
+    if lock is None:
+        lock = _connect_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _msgpack_encoder() -> Callable[[Event], bytes]:
+    """Return an Event encoder backed by the optional ormsgpack package."""
+    try:
+        import ormsgpack  # type: ignore[import]
+    except ImportError as e:
+        raise ImportError(
+            "NATS_WIRE_FORMAT=msgpack requires ormsgpack; "
+            "install it with: pip install 'tessera-sdk[msgpack]'"
+        ) from e
+
+    def encode(event: Event) -> bytes:
+        return ormsgpack.packb(event, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+
+    return encode
+
+
+def _broker_connected() -> bool:
+    """Return whether the shared broker holds a live NATS connection."""
+    try:
+        return nats_router.broker.connection.is_connected
+    except IncorrectState:
+        return False
+
+
+def _publish_extra(event: Event, subject: str) -> dict[str, str]:
+    """Build the structured log context shared by a publish's log records."""
+    return {"event_type": event.event_type, "subject": subject, "event_id": event.id}
+
 
 class NatsEventPublisher:
     """Publish account events to NATS using FastStream."""
 
+    # Events publish_sync may hold for the background worker before dropping.
+    QUEUE_MAXSIZE = 1000
+    # Queued events the worker publishes per connection check.
+    BATCH_MAX = 64
+
     def __init__(self):
         self._enabled = settings.nats_enabled
         self._logger = logger
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        if settings.nats_wire_format == "msgpack":
+            self._encode = _msgpack_encoder()
+            self._headers = MSGPACK_HEADERS
+        else:
+            self._encode = Event.to_json_bytes
+            self._headers = JSON_HEADERS
         if not self._enabled:
             self._logger.warning("NATS publishing is DISABLED by configuration")
 
@@ -32,114 +102,217 @@ class NatsEventPublisher:
         """Publish an event to NATS."""
         if not self._enabled:
             self._logger.info(
-                f"NATS publishing disabled; skipping event: {event.event_type}"
+                "NATS publishing disabled; skipping event: %s", event.event_type
             )
             return
 
         await self._publish_internal(event, subject, close_after=False)
 
     def publish_sync(self, event: Event, subject: str) -> None:
-        """Synchronously publish an event to NATS."""
-        if not self._enabled:
-            self._logger.info(
-                f"NATS publishing disabled; skipping event: {event.event_type}"
-            )
-            return
+        """
+        Publish an event from synchronous code.
 
+        Queues the event for background publishing when an event loop is
+        running, otherwise publishes it with asyncio.run. Callers that know
+        which case applies can call publish_background or publish_blocking.
+        """
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            self._logger.info(
-                f"NATS publishing event: {event.event_type} using asyncio.run"
-            )
-            asyncio.run(self._publish_internal(event, subject, close_after=True))
+            self.publish_blocking(event, subject)
         else:
+            self._publish_background(loop, event, subject)
+
+    def publish_blocking(self, event: Event, subject: str) -> None:
+        """
+        Publish an event on a fresh event loop, blocking until it is sent.
+
+        Must not be called while an event loop is running in this thread.
+        """
+        if not self._enabled:
             self._logger.info(
-                f"NATS publishing event: {event.event_type} using background task"
-            )
-            task = loop.create_task(
-                self._publish_internal(event, subject, close_after=False)
+                "NATS publishing disabled; skipping event: %s", event.event_type
             )
+            return
 
-            def _log_task_result(t: asyncio.Task) -> None:
-                exc = t.exception()
-                if exc:
-                    self._logger.exception(
-                        "Background NATS publish task failed",
-                        exc_info=exc,
-                        extra={
-                            "event_type": event.event_type,
-                            "subject": subject,
-                        },
-                    )
+        self._logger.info(
+            "NATS publishing event: %s using asyncio.run", event.event_type
+        )
+        asyncio.run(self._publish_internal(event, subject, close_after=True))
 
-            task.add_done_callback(_log_task_result)
+    def publish_background(self, event: Event, subject: str) -> None:
+        """
+        Queue an event for publishing on the running event loop.
 
-    async def _publish_internal(
-        self, event: Event, subject: str, close_after: bool
+        Raises:
+            RuntimeError: If no event loop is running in this thread
+        """
+        self._publish_background(asyncio.get_running_loop(), event, subject)
+
+    def _publish_background(
+        self, loop: asyncio.AbstractEventLoop, event: Event, subject: str
     ) -> None:
-        """Publish an event, optionally closing the connection afterwards."""
+        """Queue an event on the given running loop unless publishing is disabled."""
         if not self._enabled:
+            self._logger.info(
+                "NATS publishing disabled; skipping event: %s", event.event_type
+            )
             return
 
-        await self._ensure_connection_ready()
         self._logger.info(
-            "NATS publish attempt",
-            extra={
-                "event_type": event.event_type,
-                "subject": subject,
-                "event_id": event.id,
-            },
+            "NATS publishing event: %s using background queue", event.event_type
         )
+        self._enqueue(loop, event, subject)
+
+    def _enqueue(
+        self, loop: asyncio.AbstractEventLoop, event: Event, subject: str
+    ) -> None:
+        """
+        Queue an event for the background publish worker on the running loop.
+
+        The worker publishes queued events one at a time in order. When the
+        queue is full the event is dropped and logged rather than letting
+        pending publishes grow without bound.
+
+        Args:
+            loop: The running event loop
+            event: Event to publish
+            subject: NATS subject to publish to
+        """
+        if self._queue is None or self._queue_loop is not loop or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+            self._queue_loop = loop
+            self._worker = loop.create_task(self._publish_worker(self._queue))
         try:
-            await nats_router.broker.publish(
-                event.model_dump(mode="json"), subject=subject
-            )
-            self._logger.info(
-                "NATS publish succeeded",
+            self._queue.put_nowait((event, subject))
+        except asyncio.QueueFull:
+            self._logger.error(
+                "NATS publish queue full; dropping event",
                 extra={
                     "event_type": event.event_type,
                     "subject": subject,
                     "event_id": event.id,
                 },
             )
+
+    async def _publish_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Publish queued events in order until the worker task is cancelled.
+
+        Events that are already queued when the worker wakes are drained as
+        one batch of up to BATCH_MAX, sharing a single connection check.
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.BATCH_MAX:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._ensure_connection_ready()
+                for event, subject in batch:
+                    try:
+                        await self._send(event, subject, self._encode(event))
+                    except Exception:
+                        self._logger.exception(
+                            "Background NATS publish task failed",
+                            extra={
+                                "event_type": event.event_type,
+                                "subject": subject,
+                            },
+                        )
+            except Exception:
+                self._logger.exception(
+                    "Background NATS publish batch failed",
+                    extra={"batch_size": len(batch)},
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def publish_many(self, events: Sequence[tuple[Event, str]]) -> None:
+        """
+        Publish several events back to back over one connection check.
+
+        All payloads are encoded before the first publish. Publishing stops
+        at the first event that fails, and its error is raised.
+
+        Args:
+            events: (event, subject) pairs to publish in order
+        """
+        if not self._enabled:
+            self._logger.info(
+                "NATS publishing disabled; skipping %d events", len(events)
+            )
+            return
+
+        payloads = [self._encode(event) for event, _ in events]
+        await self._ensure_connection_ready()
+        for (event, subject), payload in zip(events, payloads):
+            await self._send(event, subject, payload)
+
+    async def _publish_internal(
+        self, event: Event, subject: str, close_after: bool
+    ) -> None:
+        """Publish an event, optionally closing the connection afterwards."""
+        if not self._enabled:
+            return
+
+        await self._ensure_connection_ready()
+        payload = self._encode(event)
+        try:
+            await self._send(event, subject, payload)
+        finally:
+            if close_after:
+                await self._reset_connection()
+
+    async def _send(self, event: Event, subject: str, payload: bytes) -> None:
+        """Publish an encoded event, resetting and retrying once on IncorrectState."""
+        headers = self._headers
+        # Skip building the log context when INFO records would be dropped;
+        # the warning/exception paths build it on demand.
+        extra = (
+            _publish_extra(event, subject)
+            if self._logger.isEnabledFor(logging.INFO)
+            else None
+        )
+        if extra is not None:
+            self._logger.info("NATS publish attempt", extra=extra)
+        try:
+            await nats_router.broker.publish(payload, subject=subject, headers=headers)
+            if extra is not None:
+                self._logger.info("NATS publish succeeded", extra=extra)
         except IncorrectState:
             self._logger.warning(
                 "NATS publish failed due to IncorrectState; resetting connection",
-                extra={"event_type": event.event_type, "subject": subject},
+                extra=extra or _publish_extra(event, subject),
             )
             await self._reset_connection()
             await self._ensure_connection_ready()
-            await nats_router.broker.publish(
-                event.model_dump(mode="json"), subject=subject
-            )
+            await nats_router.broker.publish(payload, subject=subject, headers=headers)
         except Exception:
             self._logger.exception(
-                "NATS publish failed",
-                extra={
-                    "event_type": event.event_type,
-                    "subject": subject,
-                    "event_id": event.id,
-                },
+                "NATS publish failed", extra=extra or _publish_extra(event, subject)
             )
             raise
-        finally:
-            if close_after:
-                await self._reset_connection()
 
     async def _ensure_connection_ready(self) -> None:
         """Ensure the broker connection is ready before publishing."""
-        try:
-            self._logger.debug("Ensuring NATS connection is ready")
-            await nats_router.broker.connect()
-            self._logger.debug("NATS connection ready")
-        except IncorrectState:
-            self._logger.warning("NATS connection in IncorrectState; resetting")
-            await self._reset_connection()
-            await nats_router.broker.connect()
-        except Exception:
-            self._logger.exception("NATS connect failed")
-            raise
+        if _broker_connected():
+            return
+        async with _connect_lock():
+            try:
+                self._logger.debug("Ensuring NATS connection is ready")
+                await nats_router.broker.connect()
+                self._logger.debug("NATS connection ready")
+            except IncorrectState:
+                self._logger.warning("NATS connection in IncorrectState; resetting")
+                await self._reset_connection()
+                await nats_router.broker.connect()
+            except Exception:
+                self._logger.exception("NATS connect failed")
+                raise
 
     async def _reset_connection(self) -> None:
         """Close and reset the broker connection state."""
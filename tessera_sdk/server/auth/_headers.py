@@ -0,0 +1,101 @@
+"""
+Case-insensitive header lookup shared by the auth handlers.
+"""
+
+from typing import Optional
+
+from requests.structures import CaseInsensitiveDict
+from starlette.datastructures import Headers
+
+AUTHORIZATION = "authorization"
+X_API_KEY = "x-api-key"
+
+# Lowercased Bearer scheme prefix, compared against header values as-is.
+_BEARER = "bearer "
+_BEARER_BYTES = b"bearer "
+_BEARER_LEN = len(_BEARER)
+
+# Header containers whose get() already matches names case-insensitively.
+_CASE_INSENSITIVE = (Headers, CaseInsensitiveDict)
+
+
+def get_header(headers, name: str) -> str:
+    """
+    Return the value of a header, matched case-insensitively.
+
+    Args:
+        headers: Starlette Headers, a requests CaseInsensitiveDict, or any
+            mapping; objects without get() are treated as having no headers
+        name: Lowercase header name (e.g. AUTHORIZATION)
+
+    Returns:
+        The header value, or an empty string if absent or not a string
+    """
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return ""
+    if isinstance(headers, Headers):
+        # Starlette header values are always str.
+        return value or ""
+    if value is None and not isinstance(headers, _CASE_INSENSITIVE):
+        for key, item in headers.items():
+            if isinstance(key, str) and key.lower() == name:
+                value = item
+                break
+    return value if isinstance(value, str) else ""
+
+
+def parse_bearer(authorization: str) -> str:
+    """
+    Return the token from an Authorization header value, or "" if not a Bearer value.
+
+    Args:
+        authorization: Raw Authorization header value
+
+    Returns:
+        The stripped token following the case-insensitive "Bearer " prefix
+    """
+    if (
+        len(authorization) <= _BEARER_LEN
+        or authorization[:_BEARER_LEN].lower() != _BEARER
+    ):
+        return ""
+    return authorization[_BEARER_LEN:].strip()
+
+
+def bearer_from_scope(scope) -> Optional[str]:
+    """
+    Return the Bearer token read directly from ASGI scope headers.
+
+    ASGI header names are lowercase bytes, so the match is done on bytes
+    without building a Starlette Headers object.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        The token, or None if there is no Bearer Authorization header
+    """
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            if value[:_BEARER_LEN].lower() != _BEARER_BYTES:
+                return None
+            return value[_BEARER_LEN:].decode("latin-1").strip() or None
+    return None
+
+
+def api_key_from_scope(scope) -> Optional[str]:
+    """
+    Return the X-API-Key value read directly from ASGI scope headers.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        The API key, or None if the header is absent or empty
+    """
+    for name, value in scope.get("headers", ()):
+        if name == b"x-api-key":
+            return value.decode("latin-1").strip() or None
+    return None
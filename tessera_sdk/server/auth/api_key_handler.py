@@ -1,9 +1,16 @@
+import asyncio
+from functools import cached_property
 from typing import Optional
 
 import logging
+import time
 
 from ...config import get_settings
-from ...clients.identies import IdentiesClient
+from ...clients.identies import AsyncIdentiesClient, IdentiesClient
+from ...clients.identies.schemas.introspect_response import IntrospectResponse
+from ...utils.ttl_cache import TTLCache
+from ._headers import AUTHORIZATION, X_API_KEY, get_header, parse_bearer
+from .token_handler import _token_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -15,25 +22,14 @@ def _is_api_key(token: str) -> bool:
 
 def _get_bearer_token(headers) -> str | None:
     """Extract Bearer token from Authorization header. Supports Mapping or Dict."""
-    auth = None
-    if hasattr(headers, "get"):
-        auth = headers.get("authorization") or headers.get("Authorization")
-    else:
-        if "authorization" in headers:
-            auth = headers["authorization"]
-        elif "Authorization" in headers:
-            auth = headers["Authorization"]
-        else:
-            auth = None
-    if not auth or not isinstance(auth, str):
-        return None
-    auth = auth.strip()
-    if auth.lower().startswith("bearer "):
-        return auth[7:].strip()
-    return None
+    return parse_bearer(get_header(headers, AUTHORIZATION)) or None
 
 
 class APIKeyHandler:
+    # Lifetimes of cached introspect results for active and rejected keys.
+    INTROSPECT_CACHE_TTL = 60
+    INACTIVE_KEY_CACHE_TTL = 5
+
     def __init__(self):
         self.settings = get_settings()
         self.identies_client = IdentiesClient(
@@ -41,57 +37,87 @@ class APIKeyHandler:
             timeout=int(self.settings.tesserasdk_auth_middleware_timeout),
         )
 
-    def has_api_key_header(self, headers) -> bool:
-        """
-        Check if the request has a valid X-API-Key header. Supports Mapping or Dict.
+        # Introspect results keyed by API key digest, so repeated requests
+        # with the same key skip the Identies round-trip.
+        self._introspect_cache = TTLCache(
+            maxsize=int(self.settings.tesserasdk_token_cache_size)
+        )
+
+        # In-flight async introspect calls keyed by API key digest, so a burst
+        # of requests with the same uncached key shares one round-trip.
+        self._inflight: dict[bytes, asyncio.Task] = {}
+
+    @cached_property
+    def async_identies_client(self) -> AsyncIdentiesClient:
+        """Async Identies client, created on first use by avalidate."""
+        return AsyncIdentiesClient(
+            base_url=self.settings.identies_api_url,
+            timeout=int(self.settings.tesserasdk_auth_middleware_timeout),
+            http2=self.settings.tesserasdk_auth_middleware_http2,
+        )
+
+    def extract_api_key(self, headers) -> Optional[str]:
         """
-        api_key = None
-        if hasattr(headers, "get"):
-            api_key = headers.get("x-api-key")
-            if not api_key:
-                api_key = headers.get("X-API-Key")
-        else:
-            if "x-api-key" in headers:
-                api_key = headers["x-api-key"]
-            elif "X-API-Key" in headers:
-                api_key = headers["X-API-Key"]
-            else:
-                api_key = None
+        Return the API key from the request headers, or None if absent.
 
-        if api_key and isinstance(api_key, str) and api_key.strip():
-            return True
+        The X-API-Key header (matched case-insensitively) wins; otherwise a
+        Bearer token shaped like an API key (ak_<key_id>.<secret>) is used.
+        """
+        api_key = get_header(headers, X_API_KEY).strip()
+        if api_key:
+            return api_key
 
         bearer = _get_bearer_token(headers)
         if bearer and _is_api_key(bearer):
-            return True
-        return False
+            return bearer
+        return None
+
+    def has_api_key_header(self, headers) -> bool:
+        """
+        Check if the request has a valid X-API-Key header. Supports Mapping or Dict.
+        """
+        return self.extract_api_key(headers) is not None
 
     def get_api_key(self, headers) -> str:
         """
         Get the API key from the request headers (supports Mapping or Dict).
-        Accepts both "X-API-Key" and "x-api-key" header keys,
-        case-insensitive in practice.
+        Header names are matched case-insensitively.
         """
-        api_key = None
-        if hasattr(headers, "get"):
-            api_key = headers.get("x-api-key")
-            if not api_key:
-                api_key = headers.get("X-API-Key")
-        else:
-            if "x-api-key" in headers:
-                api_key = headers["x-api-key"]
-            elif "X-API-Key" in headers:
-                api_key = headers["X-API-Key"]
-            else:
-                api_key = ""
+        return self.extract_api_key(headers) or ""
 
-        if api_key and isinstance(api_key, str) and api_key.strip():
-            return api_key.strip()
+    def _remember(self, cache_key: bytes, response: IntrospectResponse) -> None:
+        """
+        Cache an introspect result until the key expires or the cache TTL ends.
 
-        bearer = _get_bearer_token(headers)
-        if bearer and _is_api_key(bearer):
-            return bearer
-        return ""
+        Rejected keys are kept only briefly, which absorbs bursts of replayed
+        invalid keys while letting a newly created key work almost at once.
+
+        Args:
+            cache_key: Digest of the API key
+            response: Introspect result to cache
+        """
+        now = time.time()
+        if not response.active:
+            self._introspect_cache.set(
+                cache_key, response, now + self.INACTIVE_KEY_CACHE_TTL
+            )
+            return
+        expires_at = now + self.INTROSPECT_CACHE_TTL
+        if response.expires_at is not None:
+            expires_at = min(expires_at, response.expires_at.timestamp())
+        self._introspect_cache.set(cache_key, response, expires_at)
+
+    def _result(self, introspect_response: IntrospectResponse):
+        """Return the introspected user for an active key, False otherwise."""
+        if introspect_response.active:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "X-API-Key validated successfully for user: %s",
+                    introspect_response.user_id,
+                )
+            return introspect_response.user
+        else:
+            return False
 
     def validate(self, api_key: str):
         """
@@ -106,23 +132,68 @@ class APIKeyHandler:
         if not api_key:
             return False
 
-        # Set the API key as Bearer; Identies introspect accepts JWT or API key in Bearer
-        self.identies_client.session.headers.update(
-            {"Authorization": f"Bearer {api_key}"}
-        )
+        cache_key = _token_cache_key(api_key)
+        introspect_response = self._introspect_cache.get(cache_key)
+        if introspect_response is None:
+            # Identies introspect accepts JWT or API key in Bearer
+            introspect_response = self.identies_client.introspect(api_key=api_key)
+            self._remember(cache_key, introspect_response)
 
-        # Call introspect to validate the API key
-        introspect_response = self.identies_client.introspect()
+        return self._result(introspect_response)
 
-        if introspect_response.active:
-            logger.info(
-                f"X-API-Key validated successfully for user: {introspect_response.user_id}"
-            )
+    async def avalidate(self, api_key: str):
+        """
+        Validate an X-API-Key without blocking the event loop.
 
-            # Remove the Bearer header after validation
-            if "Authorization" in self.identies_client.session.headers:
-                del self.identies_client.session.headers["Authorization"]
+        Args:
+            api_key: The API key to validate
 
-            return introspect_response.user
-        else:
+        Returns:
+            The introspected user if the API key is valid, False otherwise
+        """
+        if not api_key:
             return False
+
+        cache_key = _token_cache_key(api_key)
+        introspect_response = self._introspect_cache.get(cache_key)
+        if introspect_response is None:
+            introspect_response = await self._shared_introspect(cache_key, api_key)
+
+        return self._result(introspect_response)
+
+    async def _introspect(self, cache_key: bytes, api_key: str) -> IntrospectResponse:
+        """Introspect api_key with the async client and cache the result."""
+        introspect_response = await self.async_identies_client.introspect(
+            api_key=api_key
+        )
+        self._remember(cache_key, introspect_response)
+        return introspect_response
+
+    async def _shared_introspect(
+        self, cache_key: bytes, api_key: str
+    ) -> IntrospectResponse:
+        """
+        Introspect api_key, joining a call already in flight for the same key.
+
+        The shared call is shielded so one cancelled request does not cancel
+        it for the others waiting on it.
+
+        Args:
+            cache_key: Digest of the API key
+            api_key: The API key to introspect
+
+        Returns:
+            The introspect result
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(cache_key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._introspect(cache_key, api_key))
+            self._inflight[cache_key] = task
+
+            def _forget(done: asyncio.Task) -> None:
+                if self._inflight.get(cache_key) is done:
+                    del self._inflight[cache_key]
+
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
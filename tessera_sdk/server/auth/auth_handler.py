@@ -1,15 +1,63 @@
+import threading
+from functools import cached_property
+from typing import Optional
+
 from starlette.requests import Request
 
+from ._headers import api_key_from_scope, bearer_from_scope
 from .api_key_handler import APIKeyHandler
-from .token_handler import TokenHandler
+from .token_handler import TokenHandler, _is_api_key
+
+# Process-wide handlers shared by AuthHandler instances that are not given
+# their own, created on first use.
+_default_api_key_handler: Optional[APIKeyHandler] = None
+_default_token_handler: Optional[TokenHandler] = None
+_default_handlers_lock = threading.Lock()
+
+
+def _get_default_api_key_handler() -> APIKeyHandler:
+    """Return the shared APIKeyHandler, creating it on first use."""
+    global _default_api_key_handler
+    if _default_api_key_handler is None:
+        with _default_handlers_lock:
+            if _default_api_key_handler is None:
+                _default_api_key_handler = APIKeyHandler()
+    return _default_api_key_handler
+
+
+def _get_default_token_handler() -> TokenHandler:
+    """Return the shared TokenHandler, creating it on first use."""
+    global _default_token_handler
+    if _default_token_handler is None:
+        with _default_handlers_lock:
+            if _default_token_handler is None:
+                _default_token_handler = TokenHandler()
+    return _default_token_handler
 
 
 class AuthHandler:
     """Handles both API key and Bearer token validation."""
 
-    def __init__(self, user_service_factory=None):
-        self.api_key_handler = APIKeyHandler()
-        self.token_handler = TokenHandler()
+    def __init__(
+        self,
+        user_service_factory=None,
+        api_key_handler: Optional[APIKeyHandler] = None,
+        token_handler: Optional[TokenHandler] = None,
+    ):
+        if api_key_handler is not None:
+            self.api_key_handler = api_key_handler
+        if token_handler is not None:
+            self.token_handler = token_handler
+
+    @cached_property
+    def api_key_handler(self) -> APIKeyHandler:
+        """API key handler, built lazily and shared across instances by default."""
+        return _get_default_api_key_handler()
+
+    @cached_property
+    def token_handler(self) -> TokenHandler:
+        """Bearer token handler, built lazily and shared across instances by default."""
+        return _get_default_token_handler()
 
     def validate(self, request: Request) -> bool:
         """
@@ -20,16 +68,22 @@ class AuthHandler:
         Returns:
             True if validation succeeds, False otherwise.
         """
+        if isinstance(request, Request):
+            # Read straight from the raw ASGI headers (one pass over bytes).
+            api_key = api_key_from_scope(request.scope)
+            token = bearer_from_scope(request.scope)
+            if not api_key and token and _is_api_key(token):
+                api_key = token
+        else:
+            api_key = self.api_key_handler.extract_api_key(request.headers)
+            token = self.token_handler.extract_bearer_token(request.headers)
+
         # Try API key first
-        if self.api_key_handler.has_api_key_header(request):
-            api_key = self.api_key_handler.get_api_key(request)
-            if self.api_key_handler.validate(request, api_key):
-                return True
+        if api_key and self.api_key_handler.validate(api_key):
+            return True
 
         # Try Bearer token
-        if self.token_handler.has_bearer_token_header(request):
-            token = self.token_handler.get_bearer_token(request)
-            if self.token_handler.verify(token):
-                return True
+        if token and self.token_handler.verify(token):
+            return True
 
         return False
@@ -1,28 +1,98 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+
 import jwt
 from typing import TYPE_CHECKING, Optional
 
 from ...config import get_settings
 from ..exceptions import UnauthorizedException
 from ...clients.identies import IdentiesClient
+from ...utils.ttl_cache import TTLCache
+from ._headers import AUTHORIZATION, get_header, parse_bearer
 import logging
 
 logger = logging.getLogger(__name__)
 
+# PyJWKClient instances shared across TokenHandler instances, keyed by JWKS URL,
+# so each process fetches and caches signing keys once per provider.
+_JWKS_CLIENTS: dict[str, jwt.PyJWKClient] = {}
+_JWKS_LOCK = threading.Lock()
+
 
 def _is_api_key(token: str) -> bool:
     """Return True if the token looks like an API key (ak_<key_id>.<secret>)."""
     return bool(token and token.startswith("ak_") and "." in token)
 
 
+def _get_jwks_client(jwks_url: str) -> jwt.PyJWKClient:
+    """Return the shared PyJWKClient for jwks_url, creating it on first use."""
+    client = _JWKS_CLIENTS.get(jwks_url)
+    if client is None:
+        with _JWKS_LOCK:
+            client = _JWKS_CLIENTS.get(jwks_url)
+            if client is None:
+                client = jwt.PyJWKClient(jwks_url, cache_keys=True, lifespan=300)
+                _JWKS_CLIENTS[jwks_url] = client
+    return client
+
+
+def _clear_jwks_cache() -> None:
+    """Drop all shared PyJWKClient instances (intended for tests)."""
+    with _JWKS_LOCK:
+        _JWKS_CLIENTS.clear()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Return a fixed-size digest of the raw token for use as a cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _decode_segment(segment: str) -> dict:
+    """Base64url-decode and JSON-parse a single JWT segment (no verification)."""
+    padded = segment + "=" * (-len(segment) % 4)
+    data = json.loads(base64.urlsafe_b64decode(padded))
+    if not isinstance(data, dict):
+        raise ValueError("JWT segment is not a JSON object")
+    return data
+
+
+def _peek_issuer(token: str) -> Optional[str]:
+    """Return the unverified `iss` claim of a JWT, or None if it cannot be read."""
+    try:
+        issuer = _decode_segment(token.split(".", 2)[1]).get("iss")
+    except (IndexError, ValueError):
+        return None
+    return issuer if isinstance(issuer, str) else None
+
+
+def _peek_kid(token: str) -> Optional[str]:
+    """Return the unverified `kid` header of a JWT, or None if it cannot be read."""
+    try:
+        kid = _decode_segment(token.partition(".")[0]).get("kid")
+    except ValueError:
+        return None
+    return kid if isinstance(kid, str) else None
+
+
 class TokenHandler:
     """Verifies JWT tokens and API keys, returning a payload-like dict for both."""
 
+    # Bounds for the short-lived cache of rejected tokens.
+    INVALID_TOKEN_CACHE_SIZE = 1024
+    INVALID_TOKEN_CACHE_TTL = 60
+
     def __init__(self):
         self.settings = get_settings()
         self.identies_client = IdentiesClient(
             timeout=int(self.settings.tesserasdk_auth_middleware_timeout),
         )
 
+        # A sequence, so PyJWT matches algorithms exactly rather than by substring.
+        self._algorithms = self.settings.get_oidc_algorithms()
+
         providers = self.settings.get_auth_providers()
         if not providers:
             raise ValueError("AUTH_PROVIDERS_JSON or OIDC settings are not configured.")
@@ -39,10 +109,33 @@ class TokenHandler:
                     "jwks_url": jwks_url,
                     "issuer": issuer,
                     "audience": audience,
-                    "jwks_client": jwt.PyJWKClient(jwks_url, cache_keys=True),
+                    "jwks_client": _get_jwks_client(jwks_url),
                 }
             )
 
+        # Providers grouped by issuer so verification can go straight to the
+        # provider(s) matching the token's `iss` claim.
+        self._providers_by_iss: dict[str, list[dict]] = {}
+        for provider in self.providers:
+            if provider["issuer"]:
+                self._providers_by_iss.setdefault(provider["issuer"], []).append(
+                    provider
+                )
+
+        # Provider that last verified a token signed with a given `kid`, filled
+        # in as tokens verify so later tokens go to that provider first.
+        self._kid_to_provider: dict[str, dict] = {}
+
+        # Verified JWT payloads keyed by token digest; failures are never cached.
+        self._verify_cache = TTLCache(
+            maxsize=int(self.settings.tesserasdk_token_cache_size)
+        )
+        self._verify_cache_ttl = int(self.settings.tesserasdk_token_cache_ttl)
+
+        # Rejection reasons for recently failed tokens, so replayed invalid
+        # tokens are refused without another JWKS lookup or signature check.
+        self._invalid_cache = TTLCache(maxsize=self.INVALID_TOKEN_CACHE_SIZE)
+
     def verify(self, token: str) -> dict:
         """
         Verify token as either an API key or JWT.
@@ -60,33 +153,71 @@ class TokenHandler:
         """Verify API key via Identies introspect; return payload with 'sub' for user resolution."""
         if not self.identies_client:
             raise UnauthorizedException(detail="API key verification not configured")
-        self.identies_client.session.headers.update(
-            {"Authorization": f"Bearer {token}"}
-        )
-        try:
-            response = self.identies_client.introspect()
-            if response.active and response.user_id is not None:
-                return {"sub": str(response.user_id)}
-            raise UnauthorizedException(detail="Invalid or expired API key")
-        finally:
-            if "Authorization" in self.identies_client.session.headers:
-                del self.identies_client.session.headers["Authorization"]
+        response = self.identies_client.introspect(api_key=token)
+        if response.active and response.user_id is not None:
+            return {"sub": str(response.user_id)}
+        raise UnauthorizedException(detail="Invalid or expired API key")
 
     def _verify_jwt(self, token: str) -> dict:
-        """Verify JWT and return decoded payload."""
+        """Verify JWT and return decoded payload, reusing cached verifications."""
+        cache_key = _token_cache_key(token)
+        payload = self._verify_cache.get(cache_key)
+        if payload is not None:
+            return payload
+
+        reason = self._invalid_cache.get(cache_key)
+        if reason is not None:
+            raise UnauthorizedException(reason)
+
+        try:
+            payload = self._decode_jwt(token)
+        except UnauthorizedException as error:
+            # Do not remember failures caused by an unreachable JWKS endpoint.
+            if not isinstance(
+                error.__cause__, jwt.exceptions.PyJWKClientConnectionError
+            ):
+                self._invalid_cache.set(
+                    cache_key,
+                    error.detail,
+                    time.time() + self.INVALID_TOKEN_CACHE_TTL,
+                )
+            raise
+
+        expires_at = time.time() + self._verify_cache_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        self._verify_cache.set(cache_key, payload, expires_at)
+        return payload
+
+    def _decode_jwt(self, token: str) -> dict:
+        """Verify the JWT signature and claims against the configured providers."""
         last_error: Exception | None = None
 
-        for provider in self.providers:
+        # Parse the header once here instead of once per provider in PyJWT.
+        kid = _peek_kid(token)
+        issuer = _peek_issuer(token)
+        providers = (issuer and self._providers_by_iss.get(issuer)) or self.providers
+
+        known = self._kid_to_provider.get(kid) if kid else None
+        if known is not None:
+            providers = [known] + [p for p in providers if p is not known]
+
+        for provider in providers:
             issuer = provider.get("issuer")
             audience = provider.get("audience")
             try:
-                logger.info(f"Verifying JWT with provider: {provider['jwks_url']}")
-                signing_key = (
-                    provider["jwks_client"].get_signing_key_from_jwt(token).key
-                )
+                logger.info("Verifying JWT with provider: %s", provider["jwks_url"])
+                jwks_client = provider["jwks_client"]
+                if kid:
+                    signing_key = jwks_client.get_signing_key(kid).key
+                else:
+                    signing_key = jwks_client.get_signing_key_from_jwt(token).key
             except jwt.exceptions.PyJWKClientError as error:
                 logger.error(
-                    f"Error verifying JWT with provider: {provider['jwks_url']} - {error}"
+                    "Error verifying JWT with provider: %s - %s",
+                    provider["jwks_url"],
+                    error,
                 )
                 last_error = error
                 continue
@@ -98,70 +229,36 @@ class TokenHandler:
                 payload = jwt.decode(
                     token,
                     signing_key,
-                    algorithms=self.settings.oidc_algorithms,
+                    algorithms=self._algorithms,
                     audience=audience,
                     issuer=issuer,
                 )
+                if kid:
+                    self._kid_to_provider[kid] = provider
                 return payload
             except Exception as error:
                 last_error = error
                 continue
 
         if last_error:
-            raise UnauthorizedException(str(last_error))
+            raise UnauthorizedException(str(last_error)) from last_error
         raise UnauthorizedException("Unable to verify token")
 
+    def extract_bearer_token(self, headers) -> Optional[str]:
+        """
+        Return the bearer token from the request headers, or None if absent
+        (supports Mapping or Dict).
+        """
+        return parse_bearer(get_header(headers, AUTHORIZATION)) or None
+
     def has_bearer_token_header(self, headers) -> bool:
         """
         Check if the request has a bearer token header (supports Mapping or Dict).
         """
-        authorization = None
-        if hasattr(headers, "get"):
-            authorization = headers.get("authorization")
-            if not authorization:
-                authorization = headers.get("Authorization")
-        else:
-            if "authorization" in headers:
-                authorization = headers["authorization"]
-            elif "Authorization" in headers:
-                authorization = headers["Authorization"]
-            else:
-                authorization = None
-
-        if (
-            not authorization
-            or not isinstance(authorization, str)
-            or not authorization.strip().lower().startswith("bearer ")
-        ):
-            return False
-        return True
+        return self.extract_bearer_token(headers) is not None
 
     def get_bearer_token(self, headers) -> str:
         """
         Get the bearer token from the request headers (supports Mapping or Dict).
         """
-        authorization = None
-        if hasattr(headers, "get"):
-            authorization = headers.get("authorization")
-            if not authorization:
-                authorization = headers.get("Authorization")
-        else:
-            if "authorization" in headers:
-                authorization = headers["authorization"]
-            elif "Authorization" in headers:
-                authorization = headers["Authorization"]
-            else:
-                authorization = ""
-
-        if (
-            not authorization
-            or not isinstance(authorization, str)
-            or not authorization.strip().lower().startswith("bearer ")
-        ):
-            return ""
-
-        # Remove "Bearer " (case-insensitive) from value
-        parts = authorization.strip().split(" ", 1)
-        if len(parts) == 2 and parts[0].lower() == "bearer":
-            return parts[1].strip()
-        return ""
+        return self.extract_bearer_token(headers) or ""
@@ -191,10 +191,6 @@ def authorize(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Authorization check failed",
             )
-        finally:
-            # Clean up: remove Authorization header from client session
-            if "Authorization" in custos_client.session.headers:
-                del custos_client.session.headers["Authorization"]
 
         return True
 
@@ -29,18 +29,19 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             if skip_paths is not None
             else ["/health", "/openapi.json", "/docs"]
         )
+        # str.startswith accepts a tuple and checks every prefix in one call.
+        self._skip_prefixes = tuple(self.skip_paths)
 
     async def dispatch(self, request: Request, call_next):
-        # Check if the request path starts with any of the skip paths
-        for skip_path in self.skip_paths:
-            if request.url.path.startswith(skip_path):
-                return await call_next(request)
+        # Check if the request path starts with any of the skip paths; the raw
+        # scope path avoids building request.url just for this check.
+        if request.scope["path"].startswith(self._skip_prefixes):
+            return await call_next(request)
 
         # Check for X-API-Key header first
-        if self.api_key_handler.has_api_key_header(request.headers):
-            api_key = self.api_key_handler.get_api_key(request.headers)
-
-            user = self.api_key_handler.validate(api_key)
+        api_key = self.api_key_handler.extract_api_key(request.headers)
+        if api_key:
+            user = await self.api_key_handler.avalidate(api_key)
             if not user:
                 return JSONResponse(
                     status_code=401, content={"error": "Invalid API key"}
@@ -52,16 +53,15 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Check for Bearer token (may be JWT or API key if it starts with "ak_")
-        if not self.token_handler.has_bearer_token_header(request.headers):
+        token = self.token_handler.extract_bearer_token(request.headers)
+        if not token:
             return JSONResponse(
                 status_code=401, content={"error": "Missing or invalid token"}
             )
 
-        token = self.token_handler.get_bearer_token(request.headers)
-
         # Bearer token starting with "ak_" is treated as an API key
         if token.startswith("ak_"):
-            user = self.api_key_handler.validate(token)
+            user = await self.api_key_handler.avalidate(token)
             if not user:
                 return JSONResponse(
                     status_code=401, content={"error": "Invalid API key"}
@@ -2,6 +2,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 from ...clients.identies import IdentiesClient
 from ...clients._base.exceptions import (
@@ -12,6 +13,7 @@ from ...clients._base.exceptions import (
     TesseraServerError,
 )
 from ...domain.schemas.user import UserOnboard, UserNeedsOnboarding
+from ..auth._headers import bearer_from_scope
 from ...config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,8 @@ class UserOnboardingMiddleware(BaseHTTPMiddleware):
         self.skip_onboarding_paths = (
             skip_onboarding_paths if skip_onboarding_paths is not None else []
         )
+        # str.startswith accepts a tuple and checks every prefix in one call.
+        self._skip_prefixes = tuple(self.skip_onboarding_paths)
 
         # Initialize Identies client
         self.identies_client = IdentiesClient(base_url=self.identies_api_url)
@@ -50,9 +54,8 @@ class UserOnboardingMiddleware(BaseHTTPMiddleware):
         """
 
         # Allow callers to explicitly skip onboarding on certain paths
-        for skip_path in self.skip_onboarding_paths:
-            if request.url.path.startswith(skip_path):
-                return await call_next(request)
+        if request.scope["path"].startswith(self._skip_prefixes):
+            return await call_next(request)
 
         # Check if user is already set in request state
         if not hasattr(request.state, "user") or request.state.user is None:
@@ -75,8 +78,6 @@ class UserOnboardingMiddleware(BaseHTTPMiddleware):
                 logger.error(
                     f"User onboarding failed for external_id: {user.external_id}, cannot proceed with incomplete user object"
                 )
-                from starlette.responses import JSONResponse
-
                 return JSONResponse(
                     status_code=500,
                     content={
@@ -160,29 +161,16 @@ class UserOnboardingMiddleware(BaseHTTPMiddleware):
                 logger.warning("Identies client not configured for user onboarding")
                 return None
 
-            # Get the authorization token from the request
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
+            # Get the authorization token straight from the ASGI headers
+            token = bearer_from_scope(request.scope)
+            if not token:
                 logger.warning("No Bearer token found for user onboarding")
                 return None
 
-            token = auth_header[len("Bearer ") :]
-
-            # Set the authorization token in the client for this request
-            self.identies_client.session.headers.update(
-                {"Authorization": f"Bearer {token}"}
-            )
-
-            try:
-                # Fetch complete user info from Identies using the client
-                userinfo_response = self.identies_client.userinfo()
-                logger.info(f"Userinfo response: {userinfo_response}")
-                return userinfo_response
-
-            finally:
-                # Clean up: remove the Authorization header from client after use
-                if "Authorization" in self.identies_client.session.headers:
-                    del self.identies_client.session.headers["Authorization"]
+            # Fetch complete user info from Identies using the request's token
+            userinfo_response = self.identies_client.userinfo(token=token)
+            logger.info(f"Userinfo response: {userinfo_response}")
+            return userinfo_response
 
         except TesseraAuthenticationError:
             logger.warning("Identies authentication failed during user onboarding")
@@ -0,0 +1,7 @@
+"""
+Dependency-free utilities for the Tessera SDK.
+"""
+
+from .ttl_cache import TTLCache
+
+__all__ = ["TTLCache"]
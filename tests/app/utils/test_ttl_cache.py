@@ -0,0 +1,32 @@
+import time
+
+from tessera_sdk.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_returns_value_before_expiry():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, time.time() + 60)
+
+    assert cache.get("a") == 1
+
+
+def test_ttl_cache_drops_expired_entries():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, time.time() + 60)
+    cache._entries["a"] = (time.time() - 1, 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    expires_at = time.time() + 60
+    cache.set("a", 1, expires_at)
+    cache.set("b", 2, expires_at)
+    cache.get("a")
+    cache.set("c", 3, expires_at)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
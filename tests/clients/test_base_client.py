@@ -0,0 +1,214 @@
+import asyncio
+import json
+import pickle
+
+import httpx
+import pytest
+import requests
+
+from tessera_sdk.clients._base.async_client import AsyncBaseClient
+from tessera_sdk.clients._base.client import BaseClient
+from tessera_sdk.clients._base.exceptions import (
+    TesseraAuthenticationError,
+    TesseraClientError,
+    TesseraError,
+    TesseraNotFoundError,
+    TesseraServerError,
+    TesseraValidationError,
+)
+from tessera_sdk.clients.custos import CustosClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self.text = text if payload is None else json.dumps(payload)
+        self.content = self.text.encode()
+        self.url = "https://api.example.com/items"
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    def __init__(self, response=None, error=None):
+        self.headers = {}
+        self.response = response
+        self.error = error
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def _client(session):
+    return BaseClient(base_url="https://api.example.com/", session=session)
+
+
+def test_make_request_returns_successful_response():
+    response = FakeResponse(200, {"ok": True})
+    session = FakeSession(response)
+
+    assert _client(session)._make_request("GET", "/items") is response
+    assert session.calls[0]["url"] == "https://api.example.com/items"
+
+
+@pytest.mark.parametrize(
+    "status_code,error_class,message",
+    [
+        (400, TesseraValidationError, "Bad request"),
+        (401, TesseraAuthenticationError, "Authentication failed"),
+        (404, TesseraNotFoundError, "Resource not found"),
+    ],
+)
+def test_make_request_maps_specific_status_codes(status_code, error_class, message):
+    session = FakeSession(FakeResponse(status_code))
+
+    with pytest.raises(error_class) as exc:
+        _client(session)._make_request("GET", "/items")
+
+    assert str(exc.value) == f"[BaseClient] /items: {message}"
+
+
+def test_make_request_uses_error_detail_from_body():
+    session = FakeSession(FakeResponse(400, {"detail": "name is required"}))
+
+    with pytest.raises(TesseraValidationError, match="name is required"):
+        _client(session)._make_request("POST", "/items")
+
+
+def test_make_request_maps_other_client_errors():
+    session = FakeSession(FakeResponse(409, text="conflict"))
+
+    with pytest.raises(TesseraClientError) as exc:
+        _client(session)._make_request("POST", "/items")
+
+    assert exc.value.status_code == 409
+    assert "409 conflict" in str(exc.value)
+
+
+def test_make_request_maps_server_errors():
+    session = FakeSession(FakeResponse(503))
+
+    with pytest.raises(TesseraServerError) as exc:
+        _client(session)._make_request("GET", "/items")
+
+    assert exc.value.status_code == 503
+
+
+def test_make_request_wraps_transport_errors():
+    session = FakeSession(error=requests.exceptions.ConnectionError("down"))
+
+    with pytest.raises(TesseraError, match="down"):
+        _client(session)._make_request("GET", "/items")
+
+
+def test_clients_share_pooled_session_by_default():
+    first = BaseClient(base_url="https://a.example.com", api_token="one")
+    second = BaseClient(base_url="https://b.example.com", api_token="two")
+
+    assert first.session is second.session
+    assert "Authorization" not in first.session.headers
+
+
+def test_make_request_sends_instance_headers_per_request():
+    session = FakeSession(FakeResponse(200))
+    client = BaseClient(
+        base_url="https://api.example.com", api_token="secret", session=session
+    )
+
+    client._make_request("GET", "/items", headers={"X-Trace": "1"})
+
+    headers = session.calls[0]["headers"]
+    assert headers["Authorization"] == "Bearer secret"
+    assert headers["X-Trace"] == "1"
+    assert session.headers == {}
+
+
+def _async_client(handler):
+    transport = httpx.MockTransport(handler)
+    return AsyncBaseClient(
+        base_url="https://api.example.com/",
+        api_token="secret",
+        client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_async_make_request_returns_successful_response():
+    seen = {}
+
+    def handler(request):
+        seen["url"] = str(request.url)
+        seen["authorization"] = request.headers["Authorization"]
+        return httpx.Response(200, json={"ok": True})
+
+    response = asyncio.run(_async_client(handler)._make_request("GET", "/items"))
+
+    assert response.json() == {"ok": True}
+    assert seen == {
+        "url": "https://api.example.com/items",
+        "authorization": "Bearer secret",
+    }
+
+
+def test_async_make_request_maps_status_codes():
+    client = _async_client(lambda request: httpx.Response(404))
+
+    with pytest.raises(TesseraNotFoundError, match="Resource not found"):
+        asyncio.run(client._make_request("GET", "/items"))
+
+
+def test_async_make_request_wraps_transport_errors():
+    def handler(request):
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(TesseraError, match="GET https://api.example.com/items"):
+        asyncio.run(_async_client(handler)._make_request("GET", "/items"))
+
+
+def test_make_request_drops_content_type_for_uploads():
+    session = FakeSession(FakeResponse(200))
+    client = _client(session)
+
+    client._make_request("POST", "/files", files={"file": b"data"})
+    client._make_request("GET", "/items")
+
+    assert "Content-Type" not in session.calls[0]["headers"]
+    assert session.calls[1]["headers"] is client.default_headers
+    assert client.default_headers["Content-Type"] == "application/json"
+
+
+def test_make_request_sends_pre_encoded_body():
+    session = FakeSession(FakeResponse(200))
+
+    _client(session)._make_request("POST", "/items", body=b'{"name":"a"}')
+
+    call = session.calls[0]
+    assert call["data"] == b'{"name":"a"}'
+    assert "json" not in call
+    assert call["headers"]["Content-Type"] == "application/json"
+
+
+def test_custos_client_uses_shared_session_with_gateway_retries():
+    client = CustosClient(base_url="https://custos.example.com")
+    retries = client.session.get_adapter("https://custos.example.com").max_retries
+
+    assert client.session is BaseClient(base_url="https://x.example.com").session
+    assert set(retries.status_forcelist) == {502, 503, 504}
+    assert "POST" not in retries.allowed_methods
+    assert retries.raise_on_status is False
+
+
+@pytest.mark.parametrize(
+    "error",
+    [TesseraClientError("conflict", 409), TesseraAuthenticationError("denied")],
+)
+def test_errors_keep_status_code_when_pickled(error):
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
+    assert restored.status_code == error.status_code
@@ -1,16 +1,21 @@
+import asyncio
+import json
 from datetime import datetime, timezone
 from uuid import uuid4
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
+import httpx
 import pytest
 
 from tessera_sdk.clients._base.exceptions import (
     TesseraAuthenticationError,
+    TesseraError,
     TesseraValidationError,
 )
 from tessera_sdk.constants import HTTPMethods
 from tessera_sdk.clients.custos import CustosClient
-from tessera_sdk.clients.identies import IdentiesClient
+from tessera_sdk.clients.identies import AsyncIdentiesClient, IdentiesClient
+from tessera_sdk.clients.looply import LooplyClient
 from tessera_sdk.clients.modela import ModelaClient
 from tessera_sdk.clients.modela.schemas import CompletionMessage
 from tessera_sdk.clients.quore import QuoreClient
@@ -24,8 +29,11 @@ from tessera_sdk.clients.vaulta import VaultaClient
 
 
 class DummyResponse:
-    def __init__(self, payload):
+    def __init__(self, payload, status_code=200, headers=None):
         self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self._payload
@@ -48,11 +56,255 @@ def test_identies_userinfo_returns_user():
     ) as mock_request:
         result = client.userinfo()
 
-    mock_request.assert_called_once_with(HTTPMethods.GET, "/userinfo")
+    mock_request.assert_called_once_with(HTTPMethods.GET, "/userinfo", headers=None)
     assert result.id == user_id
     assert result.email == "user@example.com"
 
 
+def test_identies_get_user_revalidates_with_etag():
+    payload = {
+        "id": str(uuid4()),
+        "email": "user@example.com",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    client = IdentiesClient(base_url="https://identies.example.com")
+    responses = [
+        DummyResponse(payload, headers={"ETag": '"v1"'}),
+        DummyResponse({}, status_code=304),
+    ]
+
+    with patch.object(
+        IdentiesClient, "_make_request", side_effect=responses
+    ) as mock_request:
+        first = client.get_user()
+        first.first_name = "Changed"
+        second = client.get_user()
+
+    # Each caller gets its own copy, so mutating one leaves the cache intact.
+    assert second is not first
+    assert second.first_name == "Ada"
+    assert second.id == first.id
+    assert mock_request.call_args_list[0].kwargs["headers"] is None
+    assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_identies_get_user_rejects_unexpected_not_modified():
+    client = IdentiesClient(base_url="https://identies.example.com")
+
+    with patch.object(
+        IdentiesClient,
+        "_make_request",
+        return_value=DummyResponse({}, status_code=304),
+    ):
+        with pytest.raises(TesseraError) as exc:
+            client.get_user()
+
+    assert exc.value.status_code == 304
+    assert "304 Not Modified without a cached response" in str(exc.value)
+
+
+def test_identies_get_user_raw_returns_decoded_dict():
+    payload = {"id": str(uuid4()), "email": "user@example.com"}
+    client = IdentiesClient(base_url="https://identies.example.com")
+
+    with patch.object(
+        IdentiesClient, "_make_request", return_value=DummyResponse(payload)
+    ):
+        result = client.get_user("user-1", raw=True)
+
+    assert result == payload
+
+
+def _async_identies(handler):
+    return AsyncIdentiesClient(
+        base_url="https://identies.example.com",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_identies_get_user_returns_user():
+    user_id = uuid4()
+    seen = {}
+
+    def handler(request):
+        seen["method"] = request.method
+        seen["path"] = request.url.path
+        return httpx.Response(
+            200,
+            json={
+                "id": str(user_id),
+                "email": "user@example.com",
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    result = asyncio.run(_async_identies(handler).get_user(str(user_id)))
+
+    assert seen == {"method": "GET", "path": f"/users/{user_id}"}
+    assert result.id == user_id
+
+
+def test_async_identies_userinfo_returns_cached_user_on_304():
+    seen = []
+
+    def handler(request):
+        seen.append(
+            (request.headers["authorization"], request.headers.get("if-none-match"))
+        )
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"'},
+            json={
+                "id": str(uuid4()),
+                "email": "user@example.com",
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    async def run():
+        client = _async_identies(handler)
+        first = await client.userinfo(token="t1")
+        second = await client.userinfo(token="t1")
+        other = await client.userinfo(token="t2")
+        return first, second, other
+
+    first, second, other = asyncio.run(run())
+
+    assert second == first
+    assert second is not first
+    assert other.id != first.id
+    assert seen == [
+        ("Bearer t1", None),
+        ("Bearer t1", '"v1"'),
+        ("Bearer t2", None),
+    ]
+
+
+def test_async_identies_list_external_accounts_sends_params():
+    seen = {}
+
+    def handler(request):
+        seen["params"] = dict(request.url.params)
+        return httpx.Response(
+            200, json={"items": [], "total": 0, "page": 2, "size": 10, "pages": 0}
+        )
+
+    result = asyncio.run(
+        _async_identies(handler).list_external_accounts(
+            platform="telegram", page=2, size=10, raw=True
+        )
+    )
+
+    assert seen["params"] == {"page": "2", "size": "10", "platform": "telegram"}
+    assert result["page"] == 2
+
+
+def _external_account(user_id):
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "id": str(uuid4()),
+        "user_id": str(user_id),
+        "platform": "telegram",
+        "external_id": "42",
+        "data": {},
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def test_identies_iter_external_accounts_fetches_pages_lazily():
+    user_id = uuid4()
+    pages = [
+        {
+            "items": [_external_account(user_id), _external_account(user_id)],
+            "total": 3,
+            "page": 1,
+            "size": 2,
+            "pages": 2,
+        },
+        {
+            "items": [_external_account(user_id)],
+            "total": 3,
+            "page": 2,
+            "size": 2,
+            "pages": 2,
+        },
+    ]
+    client = IdentiesClient(base_url="https://identies.example.com")
+
+    with patch.object(
+        IdentiesClient,
+        "_make_request",
+        side_effect=[DummyResponse(page) for page in pages],
+    ) as mock_request:
+        accounts = client.iter_external_accounts(user_id=str(user_id), size=2)
+        first = next(accounts)
+        assert mock_request.call_count == 1
+        rest = list(accounts)
+
+    assert first.user_id == user_id
+    assert len(rest) == 2
+    assert [call.kwargs["params"]["page"] for call in mock_request.call_args_list] == [
+        1,
+        2,
+    ]
+    assert mock_request.call_args_list[1].args == (
+        HTTPMethods.GET,
+        f"/users/{user_id}/external-accounts",
+    )
+
+
+def test_async_identies_iter_external_accounts_stops_on_empty_page():
+    user_id = uuid4()
+    seen = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        seen.append(page)
+        items = [_external_account(user_id)] if page == 1 else []
+        return httpx.Response(
+            200,
+            json={"items": items, "total": 1, "page": page, "size": 1, "pages": 5},
+        )
+
+    async def run():
+        client = _async_identies(handler)
+        return [account async for account in client.iter_external_accounts(size=1)]
+
+    accounts = asyncio.run(run())
+
+    assert [account.user_id for account in accounts] == [user_id]
+    assert seen == [1, 2]
+
+
+def test_identies_check_external_account_raw_skips_model():
+    payload = {"linked": False}
+    client = IdentiesClient(base_url="https://identies.example.com")
+
+    with patch.object(
+        IdentiesClient, "_make_request", return_value=DummyResponse(payload)
+    ) as mock_request:
+        result = client.check_external_account("telegram", "42", raw=True)
+
+    mock_request.assert_called_once_with(
+        HTTPMethods.POST,
+        "/external-accounts/check",
+        data={"platform": "telegram", "external_id": "42"},
+    )
+    assert result == payload
+
+
 def test_identies_introspect_uses_post():
     payload = {
         "active": True,
@@ -66,10 +318,29 @@ def test_identies_introspect_uses_post():
     ) as mock_request:
         result = client.introspect()
 
-    mock_request.assert_called_once_with(HTTPMethods.POST, "/api-keys/introspect")
+    mock_request.assert_called_once_with(
+        HTTPMethods.POST, "/api-keys/introspect", headers=None
+    )
     assert result.active is True
 
 
+def test_identies_introspect_sends_api_key_per_request():
+    payload = {"active": False}
+    client = IdentiesClient(base_url="https://identies.example.com")
+
+    with patch.object(
+        IdentiesClient, "_make_request", return_value=DummyResponse(payload)
+    ) as mock_request:
+        client.introspect(api_key="ak_123.secret")
+
+    mock_request.assert_called_once_with(
+        HTTPMethods.POST,
+        "/api-keys/introspect",
+        headers={"Authorization": "Bearer ak_123.secret"},
+    )
+    assert "Authorization" not in client.session.headers
+
+
 def test_identies_get_token_posts_oauth_token():
     payload = {
         "access_token": "jwt-here",
@@ -369,15 +640,14 @@ def test_custos_authorize_posts_request():
         )
 
     mock_request.assert_called_once_with(
-        HTTPMethods.POST,
-        "/authorization/authorize",
-        data={
-            "user_id": "user-1",
-            "action": "read",
-            "resource": "account",
-            "domain": "account:1",
-        },
+        HTTPMethods.POST, "/authorization/authorize", body=ANY
     )
+    assert json.loads(mock_request.call_args.kwargs["body"]) == {
+        "user_id": "user-1",
+        "action": "read",
+        "resource": "account",
+        "domain": "account:1",
+    }
     assert result.allowed is True
 
 
@@ -402,14 +672,13 @@ def test_custos_create_membership_posts_request():
         )
 
     mock_request.assert_called_once_with(
-        HTTPMethods.POST,
-        "/roles/role-1/memberships",
-        data={
-            "user_id": "user-1",
-            "domain": "account:1",
-            "domain_metadata": {"tier": "gold"},
-        },
+        HTTPMethods.POST, "/roles/role-1/memberships", body=ANY
     )
+    assert json.loads(mock_request.call_args.kwargs["body"]) == {
+        "user_id": "user-1",
+        "domain": "account:1",
+        "domain_metadata": {"tier": "gold"},
+    }
     assert result.membership_id == "membership-1"
 
 
@@ -699,3 +968,44 @@ def test_modela_summarize_file_omits_optional_fields_when_not_provided():
     assert call_data == {"file_url": "https://example.com/doc.pdf"}
     assert "mime_type" not in call_data
     assert "model" not in call_data
+
+
+def test_custos_schemas_resolve_lazily():
+    from tessera_sdk.clients.custos import schemas
+    from tessera_sdk.clients.custos.schemas.authorize_request import AuthorizeRequest
+
+    assert schemas.AuthorizeRequest is AuthorizeRequest
+    assert set(schemas.__all__) <= set(dir(schemas))
+    with pytest.raises(AttributeError):
+        schemas.BindingResponse
+
+
+def test_custos_membership_metadata_is_passed_through():
+    from tessera_sdk.clients.custos.schemas import CreateMembershipRequest
+
+    metadata = {"tier": {"level": 1}}
+    request = CreateMembershipRequest(
+        user_id="user-1", domain="account:1", domain_metadata=metadata
+    )
+
+    assert request.domain_metadata is metadata
+    assert json.loads(request.model_dump_json())["domain_metadata"] == metadata
+    with pytest.raises(ValueError):
+        CreateMembershipRequest(user_id="u", domain="d", domain_metadata=["x"])
+
+
+def test_looply_get_waiting_lists_for_contact_returns_models():
+    list_id = uuid4()
+    payload = [{"id": str(list_id), "name": "Beta"}]
+    client = LooplyClient(base_url="https://looply.example.com")
+
+    with patch.object(
+        LooplyClient, "_make_request", return_value=DummyResponse(payload)
+    ) as mock_request:
+        result = client.get_waiting_lists_for_contact("contact-1")
+
+    mock_request.assert_called_once_with(
+        HTTPMethods.GET, "/waiting-lists/contacts/contact-1/waiting-lists"
+    )
+    assert [item.id for item in result] == [list_id]
+    assert result[0].name == "Beta"
@@ -1,9 +1,25 @@
-from datetime import datetime
-from types import SimpleNamespace
+from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from tessera_sdk.infra.events.event import Event, event_source, event_type
+from tessera_sdk.infra.events.event import (
+    Event,
+    event_source,
+    event_type,
+    refresh_event_settings,
+)
+
+
+@pytest.fixture
+def event_settings(monkeypatch):
+    settings = SimpleNamespace(event_type_prefix="com.test", event_source_prefix="src")
+    monkeypatch.setattr("tessera_sdk.infra.events.event.get_settings", lambda: settings)
+    refresh_event_settings()
+    yield settings
+    monkeypatch.undo()
+    refresh_event_settings()
 
 
 def test_event_validates_required_fields():
@@ -27,23 +43,80 @@ def test_event_invalid_spec_version_raises():
         Event(source="/api/test", event_type="com.example", spec_version="0.3")
 
 
+@pytest.mark.parametrize("payload", [{"id": 1}, "text", b"raw"])
+def test_event_data_keeps_payload_type(payload):
+    event = Event(source="/api/test", event_type="com.example", event_data=payload)
+    assert event.event_data == payload
+    assert type(event.event_data) is type(payload)
+
+
+def test_event_data_accepts_non_dict_mapping():
+    payload = MappingProxyType({"a": 1})
+    event = Event(source="/api/test", event_type="com.example", event_data=payload)
+    assert event.event_data == {"a": 1}
+    assert type(event.event_data) is dict
+
+
+def test_event_data_rejects_unsupported_payload():
+    with pytest.raises(ValueError):
+        Event(source="/api/test", event_type="com.example", event_data=[1, 2])
+
+
+def test_event_to_json_bytes_matches_model_dump_json():
+    event = Event(source="/api/test", event_type="com.example", event_data={"a": 1})
+    assert event.to_json_bytes() == event.model_dump_json().encode()
+
+
 def test_event_time_without_timezone():
     timestamp = datetime(2024, 1, 1)
     event = Event(source="/api/test", event_type="com.example", time=timestamp)
     assert event.time == timestamp
 
 
-def test_event_helpers_use_settings(monkeypatch):
-    settings = SimpleNamespace(event_type_prefix="com.test", event_source_prefix="src")
-    monkeypatch.setattr("tessera_sdk.infra.events.event.get_settings", lambda: settings)
+def test_event_defaults_time_to_aware_utc():
+    event = Event(source="/api/test", event_type="com.example")
+    assert event.time.tzinfo is timezone.utc
+
 
+def test_event_supplied_id_skips_uuid_generation():
+    with patch("tessera_sdk.infra.events.event.uuid4") as mock_uuid4:
+        event = Event(id="evt-1", source="/api/test", event_type="com.example")
+
+    assert event.id == "evt-1"
+    mock_uuid4.assert_not_called()
+
+
+def test_event_helpers_use_settings(event_settings):
     assert event_type("account.created") == "com.test.account.created"
     assert event_source("/accounts/1") == "/src/accounts/1"
 
 
-def test_event_helpers_use_settings_without_source(monkeypatch):
-    settings = SimpleNamespace(event_type_prefix="com.test", event_source_prefix="src")
-    monkeypatch.setattr("tessera_sdk.infra.events.event.get_settings", lambda: settings)
-
+def test_event_helpers_use_settings_without_source(event_settings):
     assert event_type("account.created") == "com.test.account.created"
     assert event_source() == "/src"
+
+
+def test_event_helpers_read_settings_once(event_settings):
+    event_settings.event_type_prefix = "com.changed"
+    assert event_type("account.created") == "com.test.account.created"
+
+    refresh_event_settings()
+    assert event_type("account.created") == "com.changed.account.created"
+
+
+def test_event_helpers_load_settings_on_first_use(monkeypatch):
+    settings = SimpleNamespace(event_type_prefix="com.lazy", event_source_prefix="lazy")
+    calls = []
+
+    def get_settings():
+        calls.append(1)
+        return settings
+
+    monkeypatch.setattr("tessera_sdk.infra.events.event.get_settings", get_settings)
+    monkeypatch.setattr("tessera_sdk.infra.events.event._event_type_prefix", None)
+    monkeypatch.setattr("tessera_sdk.infra.events.event._event_source_prefix", None)
+
+    assert calls == []
+    assert event_type("account.created") == "com.lazy.account.created"
+    assert event_source("/x") == "/lazy/x"
+    assert len(calls) == 1
@@ -0,0 +1,236 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tessera_sdk.infra.events.nats_healthcheck import NatsHealthcheck
+
+MODULE = "tessera_sdk.infra.events.nats_healthcheck"
+
+
+@pytest.fixture
+def anyio_backend():
+    # The healthcheck relies on asyncio.wait_for and the asyncio event loop.
+    return "asyncio"
+
+
+def _healthcheck(enabled=True):
+    with patch(
+        f"{MODULE}.settings",
+        SimpleNamespace(nats_enabled=enabled, nats_url="nats://test:4222"),
+    ):
+        return NatsHealthcheck(timeout=0.1)
+
+
+def _client(next_msg):
+    subscription = SimpleNamespace(next_msg=next_msg)
+    client = MagicMock(is_connected=True)
+    client.connect = AsyncMock()
+    client.subscribe = AsyncMock(return_value=subscription)
+    client.close = AsyncMock()
+    return client, subscription
+
+
+async def _run(healthcheck, client, publish=None):
+    broker = SimpleNamespace(
+        connect=AsyncMock(),
+        stop=AsyncMock(),
+        publish=publish or AsyncMock(),
+    )
+    with (
+        patch(f"{MODULE}.NatsClient", return_value=client),
+        patch(f"{MODULE}.nats_router", SimpleNamespace(broker=broker)),
+        patch(
+            f"{MODULE}.settings",
+            SimpleNamespace(nats_enabled=True, nats_url="nats://test:4222"),
+        ),
+    ):
+        return await healthcheck.check()
+
+
+@pytest.mark.anyio
+async def test_check_reports_disabled():
+    result = await _healthcheck(enabled=False).check()
+
+    assert result["status"] is False
+    assert result["steps"] == [
+        {
+            "step": "Check NATS enabled",
+            "status": "failed",
+            "error": "NATS healthcheck skipped - NATS is disabled",
+        }
+    ]
+
+
+@pytest.mark.anyio
+async def test_check_round_trips_test_message():
+    published = {}
+
+    async def publish(message, subject, headers):
+        assert headers == {"content-type": "application/json"}
+        published["message"] = message
+
+    async def next_msg():
+        return SimpleNamespace(data=published["message"])
+
+    client, _ = _client(next_msg)
+    healthcheck = _healthcheck()
+
+    first = await _run(healthcheck, client, publish=publish)
+    second = await _run(healthcheck, client, publish=publish)
+
+    assert first["status"] is True
+    assert "error" not in first
+    assert [step["status"] for step in first["steps"]] == ["success"] * 10
+    assert first["steps"][-1]["step"] == "Validate message ID"
+    # The client stays open and is reused by the next check.
+    assert second["status"] is True
+    assert "Create temporary NATS client" not in [
+        step["step"] for step in second["steps"]
+    ]
+    client.connect.assert_awaited_once()
+    client.subscribe.assert_awaited_once()
+    client.close.assert_not_awaited()
+
+    await healthcheck.close()
+    client.close.assert_awaited_once()
+
+
+def test_contended_checks_on_separate_event_loops():
+    healthcheck = _healthcheck()
+    published = {}
+
+    async def publish(message, subject, headers):
+        published["message"] = message
+
+    async def next_msg():
+        await asyncio.sleep(0)
+        return SimpleNamespace(data=published["message"])
+
+    async def contended_checks():
+        results = await asyncio.gather(healthcheck.check(), healthcheck.check())
+        await healthcheck.close()
+        return results
+
+    broker = SimpleNamespace(connect=AsyncMock(), stop=AsyncMock(), publish=publish)
+    with (
+        patch(f"{MODULE}.NatsClient", side_effect=lambda: _client(next_msg)[0]),
+        patch(f"{MODULE}.nats_router", SimpleNamespace(broker=broker)),
+        patch(
+            f"{MODULE}.settings",
+            SimpleNamespace(nats_enabled=True, nats_url="nats://test:4222"),
+        ),
+    ):
+        # The second loop must not reuse a lock bound to the first.
+        for _ in range(2):
+            results = asyncio.run(contended_checks())
+            assert [result["status"] for result in results] == [True, True]
+
+
+@pytest.mark.anyio
+async def test_check_reconnects_after_connection_loss():
+    async def next_msg():
+        return SimpleNamespace(data=b"{}")
+
+    client, _ = _client(next_msg)
+    healthcheck = _healthcheck()
+    stale = MagicMock(is_connected=False, close=AsyncMock())
+    healthcheck._client = stale
+    healthcheck._client_loop = asyncio.get_running_loop()
+
+    await _run(healthcheck, client)
+
+    stale.close.assert_awaited_once()
+    client.connect.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_check_reports_receive_timeout():
+    async def next_msg():
+        await asyncio.sleep(1)
+
+    client, _ = _client(next_msg)
+    healthcheck = _healthcheck()
+
+    result = await _run(healthcheck, client)
+
+    assert result["status"] is False
+    assert "not received within 0.1s" in result["error"]
+    assert result["steps"][-1]["step"] == "Receive test message"
+    assert result["steps"][-1]["status"] == "failed"
+    # A late reply must not leak into the next check.
+    client.close.assert_awaited_once()
+    assert healthcheck._client is None
+
+
+@pytest.mark.anyio
+async def test_check_records_failed_connect_step():
+    client, _ = _client(AsyncMock())
+    client.connect.side_effect = OSError("refused")
+
+    result = await _run(_healthcheck(), client)
+
+    assert result["status"] is False
+    assert (
+        result["error"]
+        == "Healthcheck failed with Unexpected exception: OSError: refused"
+    )
+    assert result["steps"][-1] == {
+        "step": "Connect temporary NATS client",
+        "status": "failed",
+        "error": (
+            "Failed to connect to NATS server (nats://test:4222): OSError: refused"
+        ),
+    }
+    client.subscribe.assert_not_called()
+    client.close.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_check_reports_message_id_mismatch():
+    async def next_msg():
+        return SimpleNamespace(data=b'{"healthcheck_id": "other"}')
+
+    client, _ = _client(next_msg)
+
+    result = await _run(_healthcheck(), client)
+
+    assert result["status"] is False
+    assert result["error"].startswith("Healthcheck failed: Message ID mismatch.")
+    assert result["error"].endswith("got other")
+
+
+@pytest.mark.anyio
+async def test_check_reports_unparseable_message():
+    async def next_msg():
+        return SimpleNamespace(data=b"{not json")
+
+    client, _ = _client(next_msg)
+
+    result = await _run(_healthcheck(), client)
+
+    assert result["status"] is False
+    assert result["error"].startswith(
+        "Healthcheck failed: Failed to parse received message: ValueError:"
+    )
+    assert result["steps"][-1]["step"] == "Parse received message"
+
+
+@pytest.mark.anyio
+async def test_check_records_connect_timeout_once():
+    client, _ = _client(AsyncMock())
+    client.connect.side_effect = asyncio.TimeoutError()
+
+    result = await _run(_healthcheck(), client)
+
+    assert result["error"].startswith("Healthcheck failed: Connection timeout")
+    connect_steps = [
+        step
+        for step in result["steps"]
+        if step["step"] == "Connect temporary NATS client"
+    ]
+    assert len(connect_steps) == 1
+    assert connect_steps[0]["error"].startswith(
+        "Failed to connect to NATS server (nats://test:4222): TimeoutError"
+    )
@@ -1,5 +1,7 @@
+import asyncio
+import json
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -42,6 +44,129 @@ def test_publish_sync_uses_asyncio_run_when_no_loop(event):
     coro.close()
 
 
+def test_publish_background_requires_running_loop(event):
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+
+    with pytest.raises(RuntimeError):
+        publisher.publish_background(event, subject="topic")
+
+
+def test_publish_blocking_skips_when_disabled(event):
+    publisher = NatsEventPublisher()
+    publisher._enabled = False
+
+    with patch("tessera_sdk.infra.events.nats_router.asyncio.run") as mock_run:
+        publisher.publish_blocking(event, subject="topic")
+
+    mock_run.assert_not_called()
+
+
+def test_publish_blocking_serializes_connects_on_each_loop(event):
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+    active = 0
+    peak = 0
+
+    async def connect():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+
+    async def contended_publish(event, subject, close_after):
+        await asyncio.gather(*(publisher._ensure_connection_ready() for _ in range(3)))
+
+    broker = SimpleNamespace(
+        connect=connect,
+        stop=AsyncMock(),
+        connection=SimpleNamespace(is_connected=False),
+    )
+
+    with (
+        patch(
+            "tessera_sdk.infra.events.nats_router.nats_router",
+            SimpleNamespace(broker=broker),
+        ),
+        patch.object(publisher, "_publish_internal", contended_publish),
+    ):
+        # Each call runs on a fresh loop; the lock must not stay bound to the first.
+        publisher.publish_blocking(event, subject="topic")
+        publisher.publish_blocking(event, subject="topic")
+
+    assert peak == 1
+
+
+@pytest.mark.anyio
+async def test_publish_sync_queues_events_in_running_loop(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("publisher uses asyncio primitives")
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+    events = [
+        Event(source="/api/test", event_type=f"com.example.{i}") for i in range(3)
+    ]
+
+    with (
+        patch.object(publisher, "_ensure_connection_ready", AsyncMock()) as mock_ready,
+        patch.object(publisher, "_send", AsyncMock()) as mock_send,
+    ):
+        for item in events:
+            publisher.publish_sync(item, subject="topic")
+        await publisher._queue.join()
+
+    assert [call.args[0] for call in mock_send.await_args_list] == events
+    # Everything queued before the worker ran went out as one batch.
+    mock_ready.assert_awaited_once()
+    publisher._worker.cancel()
+
+
+@pytest.mark.anyio
+async def test_publish_sync_drops_events_when_queue_full(event, anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("publisher uses asyncio primitives")
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+    publisher.QUEUE_MAXSIZE = 1
+
+    with (
+        patch.object(publisher, "_ensure_connection_ready", AsyncMock()),
+        patch.object(publisher, "_send", AsyncMock()) as mock_send,
+    ):
+        publisher.publish_sync(event, subject="topic")
+        publisher.publish_sync(event, subject="topic")
+        await publisher._queue.join()
+
+    mock_send.assert_awaited_once()
+    publisher._worker.cancel()
+
+
+@pytest.mark.anyio
+async def test_publish_many_connects_once(event):
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+
+    broker = SimpleNamespace(
+        publish=AsyncMock(),
+        connect=AsyncMock(),
+        stop=AsyncMock(),
+        connection=SimpleNamespace(is_connected=False),
+    )
+
+    with patch(
+        "tessera_sdk.infra.events.nats_router.nats_router",
+        SimpleNamespace(broker=broker),
+    ):
+        await publisher.publish_many([(event, "a"), (event, "b")])
+
+    broker.connect.assert_awaited_once()
+    assert [call.kwargs["subject"] for call in broker.publish.await_args_list] == [
+        "a",
+        "b",
+    ]
+
+
 @pytest.mark.anyio
 async def test_publish_internal_retries_on_incorrect_state(event):
     publisher = NatsEventPublisher()
@@ -63,6 +188,85 @@ async def test_publish_internal_retries_on_incorrect_state(event):
         await publisher._publish_internal(event, subject="topic", close_after=True)
 
     assert broker.publish.call_count == 2
+    payload = broker.publish.call_args.args[0]
+    assert json.loads(payload) == event.model_dump(mode="json")
+    assert broker.publish.call_args.kwargs == {
+        "subject": "topic",
+        "headers": {"content-type": "application/json"},
+    }
+
+
+@pytest.mark.anyio
+async def test_publish_internal_serializes_once_across_retry(event):
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+
+    broker = SimpleNamespace(
+        publish=AsyncMock(side_effect=[Exception("bad"), None]),
+        connect=AsyncMock(),
+        stop=AsyncMock(),
+    )
+
+    with (
+        patch(
+            "tessera_sdk.infra.events.nats_router.nats_router",
+            SimpleNamespace(broker=broker),
+        ),
+        patch("tessera_sdk.infra.events.nats_router.IncorrectState", Exception),
+        patch.object(publisher, "_encode", return_value=b"{}") as mock_encode,
+    ):
+        await publisher._publish_internal(event, subject="topic", close_after=False)
+
+    mock_encode.assert_called_once_with(event)
+    first, retry = broker.publish.call_args_list
+    assert first.args[0] is retry.args[0]
+
+
+def test_publisher_msgpack_requires_ormsgpack():
+    with (
+        patch(
+            "tessera_sdk.infra.events.nats_router.settings",
+            SimpleNamespace(nats_enabled=True, nats_wire_format="msgpack"),
+        ),
+        patch.dict("sys.modules", {"ormsgpack": None}),
+    ):
+        with pytest.raises(ImportError, match="tessera-sdk\\[msgpack\\]"):
+            NatsEventPublisher()
+
+
+def test_publisher_msgpack_sets_content_type(event):
+    ormsgpack = SimpleNamespace(
+        OPT_SERIALIZE_PYDANTIC=1, packb=lambda obj, option: b"packed"
+    )
+    with (
+        patch(
+            "tessera_sdk.infra.events.nats_router.settings",
+            SimpleNamespace(nats_enabled=True, nats_wire_format="msgpack"),
+        ),
+        patch.dict("sys.modules", {"ormsgpack": ormsgpack}),
+    ):
+        publisher = NatsEventPublisher()
+
+    assert publisher._encode(event) == b"packed"
+    assert publisher._headers == {"content-type": "application/msgpack"}
+
+
+@pytest.mark.anyio
+async def test_send_skips_info_logging_when_disabled(event):
+    publisher = NatsEventPublisher()
+    publisher._logger = MagicMock()
+    publisher._logger.isEnabledFor.return_value = False
+
+    broker = SimpleNamespace(publish=AsyncMock())
+
+    with patch(
+        "tessera_sdk.infra.events.nats_router.nats_router",
+        SimpleNamespace(broker=broker),
+    ):
+        await publisher._send(event, "topic", b"{}")
+
+    publisher._logger.info.assert_not_called()
+    broker.publish.assert_awaited_once()
 
 
 @pytest.mark.anyio
@@ -98,6 +302,56 @@ async def test_ensure_connection_handles_incorrect_state():
     assert broker.connect.call_count == 2
 
 
+@pytest.mark.anyio
+async def test_ensure_connection_serializes_concurrent_connects(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("publisher uses asyncio primitives")
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+    active = 0
+    peak = 0
+
+    async def connect():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+
+    broker = SimpleNamespace(
+        connect=connect,
+        stop=AsyncMock(),
+        connection=SimpleNamespace(is_connected=False),
+    )
+
+    with patch(
+        "tessera_sdk.infra.events.nats_router.nats_router",
+        SimpleNamespace(broker=broker),
+    ):
+        await asyncio.gather(*(publisher._ensure_connection_ready() for _ in range(3)))
+
+    assert peak == 1
+
+
+@pytest.mark.anyio
+async def test_ensure_connection_skips_connect_when_connected():
+    publisher = NatsEventPublisher()
+    publisher._enabled = True
+
+    broker = SimpleNamespace(
+        connect=AsyncMock(),
+        connection=SimpleNamespace(is_connected=True),
+    )
+
+    with patch(
+        "tessera_sdk.infra.events.nats_router.nats_router",
+        SimpleNamespace(broker=broker),
+    ):
+        await publisher._ensure_connection_ready()
+
+    broker.connect.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_reset_connection_ignores_incorrect_state():
     publisher = NatsEventPublisher()
@@ -1,5 +1,5 @@
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from starlette.applications import Starlette
 from starlette.exceptions import HTTPException
@@ -43,6 +43,17 @@ def test_auth_middleware_skips_paths():
     assert response.status_code == 200
 
 
+def test_auth_middleware_skips_any_configured_prefix():
+    app = Starlette(
+        routes=[Route("/docs/oauth2-redirect", lambda request: JSONResponse({}))]
+    )
+    app.add_middleware(AuthenticationMiddleware, skip_paths=["/health", "/docs"])
+    client = TestClient(app)
+
+    assert client.get("/docs/oauth2-redirect").status_code == 200
+    assert client.get("/other").status_code == 401
+
+
 def test_auth_middleware_requires_token():
     app = _build_app()
     client = TestClient(app)
@@ -92,13 +103,15 @@ def test_auth_middleware_accepts_api_key():
     app = _build_app()
     client = TestClient(app)
 
-    introspect = SimpleNamespace(active=True, user={"id": "user-2"}, user_id="user-2")
+    introspect = SimpleNamespace(
+        active=True, user={"id": "user-2"}, user_id="user-2", expires_at=None
+    )
 
     with patch(
-        "tessera_sdk.server.auth.api_key_handler.IdentiesClient",
+        "tessera_sdk.server.auth.api_key_handler.AsyncIdentiesClient",
     ) as mock_identies_cls:
         mock_instance = mock_identies_cls.return_value
-        mock_instance.introspect.return_value = introspect
+        mock_instance.introspect = AsyncMock(return_value=introspect)
         response = client.get("/protected", headers={"X-API-Key": "key-1"})
 
     assert response.status_code == 200
@@ -109,14 +122,40 @@ def test_auth_middleware_rejects_inactive_api_key():
     app = _build_app()
     client = TestClient(app)
 
-    introspect = SimpleNamespace(active=False, user=None, user_id=None)
+    introspect = SimpleNamespace(active=False, user=None, user_id=None, expires_at=None)
 
     with patch(
-        "tessera_sdk.server.auth.api_key_handler.IdentiesClient",
+        "tessera_sdk.server.auth.api_key_handler.AsyncIdentiesClient",
     ) as mock_identies_cls:
         mock_instance = mock_identies_cls.return_value
-        mock_instance.introspect.return_value = introspect
+        mock_instance.introspect = AsyncMock(return_value=introspect)
         response = client.get("/protected", headers={"X-API-Key": "key-1"})
 
     assert response.status_code == 401
     assert response.json() == {"error": "Invalid API key"}
+
+
+def test_auth_middleware_awaits_introspect_for_bearer_api_key():
+    app = _build_app()
+    client = TestClient(app)
+
+    introspect = SimpleNamespace(
+        active=True, user={"id": "user-3"}, user_id="user-3", expires_at=None
+    )
+
+    with (
+        patch("tessera_sdk.server.auth.api_key_handler.IdentiesClient") as sync_cls,
+        patch(
+            "tessera_sdk.server.auth.api_key_handler.AsyncIdentiesClient",
+        ) as mock_identies_cls,
+    ):
+        mock_instance = mock_identies_cls.return_value
+        mock_instance.introspect = AsyncMock(return_value=introspect)
+        response = client.get(
+            "/protected", headers={"Authorization": "Bearer ak_1.secret"}
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"user_id": "user-3"}
+    mock_instance.introspect.assert_awaited_once_with(api_key="ak_1.secret")
+    sync_cls.return_value.introspect.assert_not_called()
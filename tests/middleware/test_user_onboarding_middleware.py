@@ -114,12 +114,13 @@ def test_onboarding_creates_user_when_needed():
         patch(
             "tessera_sdk.server.middleware.user_onboarding.IdentiesClient.userinfo",
             return_value=userinfo,
-        ),
+        ) as userinfo_mock,
     ):
         response = client.get("/protected", headers={"Authorization": "Bearer token"})
 
     assert response.status_code == 200
     assert response.json() == {"user_id": "local-1"}
+    userinfo_mock.assert_called_once_with(token="token")
 
 
 def test_onboarding_returns_error_when_onboard_fails():
@@ -1,14 +1,36 @@
+import asyncio
+import base64
+import json
+import time
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import jwt
 import pytest
 from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.requests import Request
 
-from tessera_sdk.server.auth.token_handler import TokenHandler
+from tessera_sdk.server.auth._headers import (
+    AUTHORIZATION,
+    api_key_from_scope,
+    bearer_from_scope,
+    get_header,
+)
+from tessera_sdk.server.auth.api_key_handler import APIKeyHandler
+from tessera_sdk.server.auth.auth_handler import AuthHandler
+from tessera_sdk.server.auth.token_handler import TokenHandler, _clear_jwks_cache
 from tessera_sdk.server.exceptions import UnauthorizedException
 
 
+@pytest.fixture(autouse=True)
+def clear_jwks_cache():
+    _clear_jwks_cache()
+    yield
+    _clear_jwks_cache()
+
+
 def _mock_settings():
     def get_auth_providers():
         return [
@@ -22,9 +44,12 @@ def _mock_settings():
     return SimpleNamespace(
         oidc_domain="test.oidc.com",
         oidc_algorithms="RS256",
+        get_oidc_algorithms=lambda: ("RS256",),
         oidc_api_audience="https://test-api",
         oidc_issuer="https://test.oidc.com/",
         tesserasdk_auth_middleware_timeout=3,
+        tesserasdk_token_cache_size=4096,
+        tesserasdk_token_cache_ttl=300,
         get_auth_providers=get_auth_providers,
     )
 
@@ -33,11 +58,17 @@ class DummyJWKS:
     def __init__(self, key="signing-key"):
         self.key = key
 
+    def get_signing_key(self, kid):
+        return SimpleNamespace(key=self.key)
+
     def get_signing_key_from_jwt(self, token):
         return SimpleNamespace(key=self.key)
 
 
 class DummyJWKSFailure:
+    def get_signing_key(self, kid):
+        raise jwt.exceptions.PyJWKClientError("bad key")
+
     def get_signing_key_from_jwt(self, token):
         raise jwt.exceptions.PyJWKClientError("bad key")
 
@@ -96,3 +127,315 @@ def test_verify_token_returns_payload(mock_get_settings):
 
     assert result == payload
     assert result["sub"] == "external-2"
+
+
+@patch("tessera_sdk.server.auth.token_handler.get_settings", side_effect=_mock_settings)
+def test_verify_token_caches_successful_verification(mock_get_settings):
+    payload = {"sub": "external-3"}
+
+    with (
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+            return_value=DummyJWKS(),
+        ),
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.decode",
+            return_value=payload,
+        ) as mock_decode,
+    ):
+        handler = TokenHandler()
+        assert handler.verify("token") == payload
+        assert handler.verify("token") == payload
+
+    mock_decode.assert_called_once()
+
+
+@patch("tessera_sdk.server.auth.token_handler.get_settings", side_effect=_mock_settings)
+def test_verify_token_does_not_cache_expired_payload(mock_get_settings):
+    payload = {"sub": "external-4", "exp": 1}
+
+    with (
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+            return_value=DummyJWKS(),
+        ),
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.decode",
+            return_value=payload,
+        ) as mock_decode,
+    ):
+        handler = TokenHandler()
+        handler.verify("token")
+        handler.verify("token")
+
+    assert mock_decode.call_count == 2
+
+
+@patch("tessera_sdk.server.auth.token_handler.get_settings", side_effect=_mock_settings)
+def test_token_handlers_share_jwks_client(mock_get_settings):
+    with patch(
+        "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+        side_effect=lambda *args, **kwargs: DummyJWKS(),
+    ) as mock_jwks_client:
+        first = TokenHandler()
+        second = TokenHandler()
+
+    mock_jwks_client.assert_called_once()
+    assert first.providers[0]["jwks_client"] is second.providers[0]["jwks_client"]
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"authorization": "Bearer abc"},
+        {"Authorization": "Bearer abc"},
+        {"AUTHORIZATION": "bearer abc"},
+    ],
+)
+@patch("tessera_sdk.server.auth.token_handler.get_settings", side_effect=_mock_settings)
+def test_get_bearer_token_matches_header_case_insensitively(mock_get_settings, headers):
+    with patch(
+        "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+        return_value=DummyJWKS(),
+    ):
+        handler = TokenHandler()
+
+    assert handler.has_bearer_token_header(headers) is True
+    assert handler.get_bearer_token(headers) == "abc"
+
+
+def _mock_multi_provider_settings():
+    settings = _mock_settings()
+    settings.get_auth_providers = lambda: [
+        {
+            "jwks_url": "https://one.example.com/.well-known/jwks.json",
+            "issuer": "https://one.example.com/",
+            "audience": "https://test-api",
+        },
+        {
+            "jwks_url": "https://two.example.com/.well-known/jwks.json",
+            "issuer": "https://two.example.com/",
+            "audience": "https://test-api",
+        },
+    ]
+    return settings
+
+
+def _unsigned_token(claims):
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'RS256', 'kid': 'k1'})}.{encode(claims)}.signature"
+
+
+@patch(
+    "tessera_sdk.server.auth.token_handler.get_settings",
+    side_effect=_mock_multi_provider_settings,
+)
+def test_verify_token_uses_provider_matching_issuer(mock_get_settings):
+    first, second = DummyJWKSFailure(), DummyJWKS()
+    token = _unsigned_token({"iss": "https://two.example.com/", "sub": "ext-5"})
+
+    with (
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+            side_effect=[first, second],
+        ),
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.decode",
+            return_value={"sub": "ext-5"},
+        ) as mock_decode,
+        patch.object(DummyJWKSFailure, "get_signing_key", side_effect=AssertionError),
+    ):
+        handler = TokenHandler()
+        assert handler.verify(token) == {"sub": "ext-5"}
+
+    assert mock_decode.call_args.kwargs["issuer"] == "https://two.example.com/"
+
+
+@patch(
+    "tessera_sdk.server.auth.token_handler.get_settings",
+    side_effect=_mock_multi_provider_settings,
+)
+def test_verify_token_routes_known_kid_to_its_provider(mock_get_settings):
+    first, second = DummyJWKS(), DummyJWKS()
+
+    with (
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+            side_effect=[first, second],
+        ),
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.decode",
+            side_effect=[jwt.InvalidIssuerError("wrong"), {"sub": "a"}, {"sub": "b"}],
+        ),
+    ):
+        handler = TokenHandler()
+        assert handler.verify(_unsigned_token({"sub": "a"})) == {"sub": "a"}
+        with patch.object(first, "get_signing_key", side_effect=AssertionError):
+            assert handler.verify(_unsigned_token({"sub": "b"})) == {"sub": "b"}
+
+
+@patch("tessera_sdk.server.auth.token_handler.get_settings", side_effect=_mock_settings)
+def test_verify_token_rejects_replayed_invalid_token_from_cache(mock_get_settings):
+    with (
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.PyJWKClient",
+            return_value=DummyJWKS(),
+        ),
+        patch(
+            "tessera_sdk.server.auth.token_handler.jwt.decode",
+            side_effect=Exception("bad"),
+        ) as mock_decode,
+    ):
+        handler = TokenHandler()
+
+        for _ in range(2):
+            with pytest.raises(UnauthorizedException) as exc:
+                handler.verify("token")
+            assert exc.value.detail == "bad"
+
+    mock_decode.assert_called_once()
+
+
+def _api_key_handler(introspect):
+    settings = SimpleNamespace(
+        identies_api_url="https://identies.test",
+        tesserasdk_auth_middleware_timeout=3,
+        tesserasdk_token_cache_size=16,
+    )
+    with (
+        patch(
+            "tessera_sdk.server.auth.api_key_handler.get_settings",
+            return_value=settings,
+        ),
+        patch("tessera_sdk.server.auth.api_key_handler.IdentiesClient") as client_cls,
+    ):
+        handler = APIKeyHandler()
+    client_cls.return_value.introspect.side_effect = introspect
+    return handler, client_cls.return_value
+
+
+def test_api_key_handler_caches_active_introspect():
+    user = {"id": "user-1"}
+    handler, client = _api_key_handler(
+        [SimpleNamespace(active=True, user=user, user_id="user-1", expires_at=None)]
+    )
+
+    assert handler.validate("ak_1.secret") is user
+    assert handler.validate("ak_1.secret") is user
+    client.introspect.assert_called_once_with(api_key="ak_1.secret")
+
+
+def test_api_key_handler_caps_cache_at_key_expiry():
+    expired = SimpleNamespace(
+        active=True,
+        user={"id": "user-1"},
+        user_id="user-1",
+        expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+    )
+    handler, client = _api_key_handler([expired, expired])
+
+    handler.validate("ak_1.secret")
+    handler.validate("ak_1.secret")
+
+    assert client.introspect.call_count == 2
+
+
+def test_api_key_handler_caches_inactive_key_briefly():
+    inactive = SimpleNamespace(active=False, user=None, user_id=None, expires_at=None)
+    handler, client = _api_key_handler([inactive, inactive])
+
+    assert handler.validate("ak_1.bad") is False
+    assert handler.validate("ak_1.bad") is False
+    client.introspect.assert_called_once()
+
+    with patch(
+        "tessera_sdk.server.auth.api_key_handler.time.time",
+        return_value=time.time() + APIKeyHandler.INACTIVE_KEY_CACHE_TTL + 1,
+    ):
+        handler.validate("ak_1.bad")
+    # The expired entry is dropped by the cache on its next lookup.
+    assert client.introspect.call_count == 2
+
+
+def test_api_key_handler_coalesces_concurrent_async_introspects():
+    user = {"id": "user-1"}
+    handler, _ = _api_key_handler([])
+    calls = []
+
+    async def introspect(api_key):
+        calls.append(api_key)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(
+            active=True, user=user, user_id="user-1", expires_at=None
+        )
+
+    async_client = SimpleNamespace(introspect=introspect)
+
+    async def run():
+        with patch.object(APIKeyHandler, "async_identies_client", new=async_client):
+            return await asyncio.gather(
+                *(handler.avalidate("ak_1.secret") for _ in range(3)),
+                handler.avalidate("ak_2.secret"),
+            )
+
+    results = asyncio.run(run())
+
+    assert results == [user] * 4
+    assert calls == ["ak_1.secret", "ak_2.secret"]
+    assert handler._inflight == {}
+
+
+def test_auth_handler_builds_handlers_lazily():
+    with (
+        patch("tessera_sdk.server.auth.auth_handler.APIKeyHandler") as api_key_cls,
+        patch("tessera_sdk.server.auth.auth_handler.TokenHandler") as token_cls,
+        patch("tessera_sdk.server.auth.auth_handler._default_api_key_handler", None),
+        patch("tessera_sdk.server.auth.auth_handler._default_token_handler", None),
+    ):
+        first = AuthHandler()
+        api_key_cls.assert_not_called()
+        token_cls.assert_not_called()
+
+        second = AuthHandler()
+        assert first.token_handler is second.token_handler
+        api_key_cls.assert_not_called()
+        token_cls.assert_called_once()
+
+
+def test_auth_handler_validates_api_key_from_request():
+    api_key_handler = MagicMock()
+    token_handler = MagicMock()
+    request = Request(
+        {"type": "http", "headers": [(b"authorization", b"Bearer ak_1.secret")]}
+    )
+
+    handler = AuthHandler(api_key_handler=api_key_handler, token_handler=token_handler)
+
+    assert handler.validate(request) is True
+    api_key_handler.validate.assert_called_once_with("ak_1.secret")
+    token_handler.verify.assert_not_called()
+
+
+def test_scope_header_helpers_read_raw_asgi_headers():
+    scope = {
+        "headers": [
+            (b"authorization", b"BEARER abc"),
+            (b"x-api-key", b" ak_1.secret "),
+        ]
+    }
+
+    assert bearer_from_scope(scope) == "abc"
+    assert api_key_from_scope(scope) == "ak_1.secret"
+    assert bearer_from_scope({"headers": [(b"authorization", b"Basic x")]}) is None
+    assert api_key_from_scope({"headers": []}) is None
+
+
+def test_get_header_handles_any_header_container():
+    assert (
+        get_header(Headers({"Authorization": "Bearer a"}), AUTHORIZATION) == "Bearer a"
+    )
+    assert get_header({"AUTHORIZATION": "Bearer b"}, AUTHORIZATION) == "Bearer b"
+    assert get_header({"authorization": 1}, AUTHORIZATION) == ""
+    assert get_header(None, AUTHORIZATION) == ""
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from tessera_sdk.config import Settings, get_settings
+
+
+def test_get_settings_returns_cached_instance(monkeypatch):
+    get_settings.cache_clear()
+    monkeypatch.setenv("CUSTOS_API_URL", "https://custos.example.com")
+
+    first = get_settings()
+    monkeypatch.setenv("CUSTOS_API_URL", "https://other.example.com")
+
+    assert get_settings() is first
+    assert first.custos_api_url == "https://custos.example.com"
+
+    get_settings.cache_clear()
+    assert get_settings().custos_api_url == "https://other.example.com"
+    get_settings.cache_clear()
+
+
+def test_get_oidc_jwks_urls_returns_shared_tuple():
+    settings = Settings(oidc_jwks_urls="https://a/jwks, https://b/jwks,https://a/jwks")
+
+    urls = settings.get_oidc_jwks_urls()
+
+    assert urls == ("https://a/jwks", "https://b/jwks")
+    assert settings.get_oidc_jwks_urls() is urls
+
+
+def test_get_auth_providers_parses_json_once():
+    settings = Settings(
+        auth_providers_json='[{"jwks_url": "https://a/jwks", "issuer": "https://a/"}]'
+    )
+
+    with patch("tessera_sdk.config.json.loads") as mock_loads:
+        providers = settings.get_auth_providers()
+        providers[0]["issuer"] = "mutated"
+
+        assert settings.get_auth_providers() == [
+            {"jwks_url": "https://a/jwks", "issuer": "https://a/"}
+        ]
+    mock_loads.assert_not_called()
+
+
+def test_auth_providers_json_must_be_a_list():
+    with pytest.raises(ValidationError, match="must be a list"):
+        Settings(auth_providers_json='{"jwks_url": "https://a/jwks"}')
+
+
+def test_settings_are_frozen():
+    settings = Settings()
+
+    with pytest.raises(ValidationError):
+        settings.environment = "production"
+
+
+@pytest.mark.parametrize(
+    "environment, is_production, is_test",
+    [("Production", True, False), ("TEST", False, True), ("development", False, False)],
+)
+def test_environment_flags(environment, is_production, is_test):
+    settings = Settings(environment=environment)
+
+    assert settings.is_production is is_production
+    assert settings.is_test is is_test
+
+
+def test_settings_read_env_aliases_and_field_names(monkeypatch):
+    monkeypatch.setenv("REDIS_PORT", "6380")
+    monkeypatch.setenv("NATS_ENABLED", "true")
+
+    settings = Settings()
+
+    assert settings.redis_port == 6380
+    assert settings.nats_enabled is True
+    assert Settings(redis_host="cache.internal").redis_host == "cache.internal"
+
+
+def test_oidc_lists_are_parsed_at_validation():
+    settings = Settings(oidc_algorithms="RS256, ES256", oidc_jwks_urls="https://a/jwks")
+
+    assert settings.get_oidc_algorithms() == ("RS256", "ES256")
+    assert settings.get_oidc_jwks_urls() == ("https://a/jwks",)